@@ -0,0 +1,49 @@
+    # Library import
+import time
+import warnings
+import numpy as np
+    # Custom package import
+from package.KHPS2_adaptive import adaptive_locus_surface
+from package.KHPS2_result import locus_surface_grid
+from .benchmark_utils import EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM
+
+    # Calibrated parameters of the example specimen set (Main_Run_Function.ipynb)
+EXAMPLE_FINAL_G = np.array([-0.12579053, 1.24632031, 3.0, 0.09386197, 1.37915676, 0.3136368])
+
+
+    # Adaptive versus dense locus surface comparison
+def run_benchmark(G_params=EXAMPLE_FINAL_G, settings=((1e-2, 6), (1e-2, 7), (1e-3, 6), (1e-3, 8), (1e-3, 9)),
+                  dense_resolution=999):
+    """
+    Builds the dense locus grid and adaptive meshes for several (tolerance, max_depth)
+    settings, and returns the
+    number of evaluations, build time, maximum / mean interpolation error against the dense
+    grid points, the share of dense points whose finite/suppressed state differs, and the
+    'max_error' and number of unresolved cells reported by the mesh.
+    """
+    start = time.perf_counter()
+    x_tri, y_invar, ef, _ = locus_surface_grid(G_params, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM,
+                                               {'grid_resolution': dense_resolution})
+    rows = [('dense grid', ef.size, time.perf_counter() - start, 0.0, 0.0, 0.0, 0.0, 0)]
+    for tolerance, max_depth in settings:
+        start = time.perf_counter()
+        with warnings.catch_warnings():         # Unresolved cells are reported in the table
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mesh = adaptive_locus_surface(G_params, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM, tolerance,
+                                          max_depth=max_depth)
+        build_time = time.perf_counter() - start
+        ef_mesh = mesh.interpolate(x_tri, y_invar)
+        both = np.isfinite(ef) & np.isfinite(ef_mesh)
+        error = np.abs(ef_mesh[both] - ef[both])
+        mismatch = np.mean(np.isfinite(ef) != np.isfinite(ef_mesh))
+        rows.append((f"tol={tolerance:g} depth={max_depth}", mesh.n_evaluations, build_time,
+                     error.max(), error.mean(), mismatch, mesh.max_error, len(mesh.unresolved_cells)))
+    return rows
+
+
+if __name__ == '__main__':
+    for label, evaluations, build_time, max_error, mean_error, mismatch, mesh_error, unresolved in run_benchmark():
+        print(f"{label:<22} evaluations = {evaluations:>8}   time = {build_time * 1e3:8.1f} ms   "
+              f"max error = {max_error:.2e}   mean error = {mean_error:.2e}   "
+              f"finite/NaN mismatch = {mismatch * 100:.2f} %   "
+              f"mesh max error = {mesh_error:.2e}   unresolved cells = {unresolved}")
@@ -0,0 +1,33 @@
+    # Library import
+import os
+import time
+    # Custom package import
+from package.KHPS2_batch import calibrate_many
+from .benchmark_utils import (EXAMPLE_INITIAL_G, EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS,
+                              EXAMPLE_OPTIMIZATION_OPTIONS, EXAMPLE_DENOMINATOR_EPSILON, synthetic_specimen_data)
+
+
+    # Batch calibration scaling with the number of worker processes
+def run_benchmark(n_materials=400, n_specimens=10, worker_counts=None):
+    """
+    Calibrates 'n_materials' synthetic materials with an increasing number of workers and
+    returns a list of (workers, wall time, materials per second, failed materials).
+    """
+    datasets = {f"material{i + 1}": synthetic_specimen_data(n_specimens, seed=i) for i in range(n_materials)}
+    worker_counts = worker_counts or sorted({1, 2, 4, os.cpu_count() or 1})
+    rows = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        records = calibrate_many(datasets, EXAMPLE_INITIAL_G, EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS,
+                                 EXAMPLE_OPTIMIZATION_OPTIONS, EXAMPLE_DENOMINATOR_EPSILON,
+                                 analytic_jacobian=True, workers=workers)
+        wall_time = time.perf_counter() - start
+        rows.append((workers, wall_time, n_materials / wall_time, int((~records['success']).sum())))
+    return rows
+
+
+if __name__ == '__main__':
+    rows = run_benchmark()
+    for workers, wall_time, throughput, failed in rows:
+        print(f"workers = {workers:>3}   time = {wall_time:7.2f} s   {throughput:8.1f} materials/s   "
+              f"speed-up = {rows[0][1] / wall_time:5.2f}x   failed = {failed}")
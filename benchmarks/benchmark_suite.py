@@ -0,0 +1,196 @@
+    # Library import
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import scipy
+    # Custom package import
+from package.KHPS2_calculation import KHPS2_optimization
+from package.KHPS2_function import KHPS2_function
+from package.KHPS2_residual import KHPS2Residual
+from package.KHPS2_result import locus_surface_grid, plane_stress_curve
+from .adaptive_benchmark import EXAMPLE_FINAL_G
+from .benchmark_utils import (EXAMPLE_SPECIMEN_DATA, EXAMPLE_INITIAL_G, EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS,
+                              EXAMPLE_OPTIMIZATION_OPTIONS, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM,
+                              EXAMPLE_PLOTTING_OPTIONS, synthetic_specimen_data)
+
+    # Benchmark configurations - specimen set sizes and locus grid resolutions
+CONFIGURATIONS = {
+    'full': {'specimen_sizes': (8, 100, 1000), 'grid_resolutions': (199, 499, 999), 'repeat': 5},
+    'quick': {'specimen_sizes': (8, 100), 'grid_resolutions': (199, 499), 'repeat': 3}}
+
+    # Default relative slow-down (time and peak memory) reported as a regression
+DEFAULT_THRESHOLD = 0.20
+
+    # Absolute changes below these are timer / allocator noise and never regressions
+NOISE_FLOOR = {'time_best': 5e-6, 'peak_memory': 4096}
+
+
+    # Benchmark cases - name: (stage, parameters, function run once per measurement)
+def benchmark_cases(specimen_sizes, grid_resolutions):
+    """
+    Returns a dictionary {case_name: (stage, parameters, function)} of the benchmarked stages:
+        - 'residual': one evaluation of KHPS2_function and of KHPS2Residual,
+        - 'solve': the full least squares calibration (finite difference and analytic Jacobian),
+        - 'locus_grid': the locus surface grid and the plane stress curve, and the memory-lean
+          float64 / float32 surface grid,
+        - 'plotting': off-screen rendering of the complete figure (example specimens).
+    The synthetic specimen sets are seeded, so the cases are reproducible.
+    """
+    cases = {}
+    for n in specimen_sizes:
+        specimen_data = EXAMPLE_SPECIMEN_DATA if n == len(EXAMPLE_SPECIMEN_DATA) else synthetic_specimen_data(n)
+        residual = KHPS2Residual(specimen_data, EXAMPLE_DENOMINATOR_EPSILON)
+        cases[f'residual/KHPS2_function/n={n}'] = (
+            'residual', {'n_specimens': n},
+            lambda data=specimen_data: KHPS2_function(EXAMPLE_INITIAL_G, data, EXAMPLE_DENOMINATOR_EPSILON))
+        cases[f'residual/KHPS2Residual/n={n}'] = (
+            'residual', {'n_specimens': n}, lambda residual=residual: residual(EXAMPLE_INITIAL_G))
+        for analytic_jacobian in (False, True):
+            mode = 'analytic' if analytic_jacobian else 'finite_difference'
+            cases[f'solve/{mode}/n={n}'] = (
+                'solve', {'n_specimens': n, 'analytic_jacobian': analytic_jacobian},
+                lambda data=specimen_data, analytic_jacobian=analytic_jacobian: KHPS2_optimization(
+                    data, EXAMPLE_INITIAL_G, EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS,
+                    EXAMPLE_OPTIMIZATION_OPTIONS, EXAMPLE_DENOMINATOR_EPSILON, analytic_jacobian))
+    for resolution in grid_resolutions:
+        locus_options = {'grid_resolution': resolution, 'plane_stress_resolution': resolution}
+        cases[f'locus_grid/resolution={resolution}'] = (
+            'locus_grid', {'grid_resolution': resolution},
+            lambda locus_options=locus_options: (
+                locus_surface_grid(EXAMPLE_FINAL_G, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM, locus_options),
+                plane_stress_curve(EXAMPLE_FINAL_G, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM, locus_options)))
+        for dtype in ('float64', 'float32'):
+            lean_options = dict(locus_options, dtype=dtype)
+            cases[f'locus_grid/lean_{dtype}/resolution={resolution}'] = (
+                'locus_grid', {'grid_resolution': resolution, 'dtype': dtype},
+                lambda lean_options=lean_options: locus_surface_grid(EXAMPLE_FINAL_G, EXAMPLE_DENOMINATOR_EPSILON,
+                                                                     EXAMPLE_Z_LIM, lean_options))
+        cases[f'plotting/resolution={resolution}'] = (
+            'plotting', {'grid_resolution': resolution}, _plotting_case(locus_options))
+    return cases
+
+
+def _plotting_case(locus_options):
+    # Off-screen rendering of the example figure - the locus grid is prepared by the warm-up call
+    def render():
+        from package.KHPS2_plotting import KHPS2_plotting
+        if not grid:
+            grid.extend(locus_surface_grid(EXAMPLE_FINAL_G, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM, locus_options) +
+                        plane_stress_curve(EXAMPLE_FINAL_G, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM, locus_options))
+        x_tri, y_invar, ef, tri_c, tri1, invar1, ef1 = grid
+        ef_k, tri_k, invar_k = np.array(list(EXAMPLE_SPECIMEN_DATA.values())).T
+        with tempfile.TemporaryDirectory() as directory:
+            KHPS2_plotting(x_tri, y_invar, ef, tri1, invar1, ef1, tri_k, invar_k, ef_k, EXAMPLE_SPECIMEN_DATA,
+                           dict(EXAMPLE_PLOTTING_OPTIONS, output_file=os.path.join(directory, 'locus.png')), tri_c)
+    grid = []
+    return render
+
+
+    # Timing and peak memory of one case
+def measure(function, repeat):
+    """
+    Runs 'function' once as a warm-up, then 'repeat' timed calls, then one call under
+    'tracemalloc'. Returns a dictionary with the best and median wall time [s] and the
+    peak traced memory [bytes] of a single call (Python and NumPy allocations).
+    """
+    function()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'time_best': min(times), 'time_median': statistics.median(times), 'peak_memory': peak_memory}
+
+
+    # Benchmark suite run
+def run_suite(configuration='full', stages=None, repeat=None):
+    """
+    Runs the benchmark cases of a configuration ('full' or 'quick'), optionally restricted to
+    the given stages, and returns the JSON-serializable report:
+        {'metadata': {...}, 'results': {case_name: {'stage', 'parameters', 'time_best',
+                                                    'time_median', 'peak_memory'}}}
+    """
+    settings = CONFIGURATIONS[configuration]
+    repeat = repeat or settings['repeat']
+    results = {}
+    for name, (stage, parameters, function) in benchmark_cases(settings['specimen_sizes'],
+                                                               settings['grid_resolutions']).items():
+        if stages and stage not in stages:
+            continue
+        results[name] = {'stage': stage, 'parameters': parameters, **measure(function, repeat)}
+    metadata = {'configuration': configuration, 'repeat': repeat, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(), 'numpy': np.__version__, 'scipy': scipy.__version__,
+                'platform': platform.platform(), 'processor': platform.processor(), 'cpu_count': os.cpu_count()}
+    return {'metadata': metadata, 'results': results}
+
+
+    # Comparison against a stored baseline report
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares the cases present in both reports and returns a list of rows
+    (case_name, metric, baseline value, current value, ratio, regression flag) for the
+    'time_best' and 'peak_memory' metrics. A case regresses when current / baseline > 1 + threshold
+    and the increase exceeds the 'NOISE_FLOOR' of the metric.
+    """
+    rows = []
+    for name, current in report['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            continue
+        for metric in ('time_best', 'peak_memory'):
+            increase = current[metric] - reference[metric]
+            if reference[metric]:
+                ratio = current[metric] / reference[metric]
+            else:
+                ratio = np.inf if increase > 0 else 1.0
+            regression = bool(ratio > 1 + threshold and increase > NOISE_FLOOR[metric])
+            rows.append((name, metric, reference[metric], current[metric], ratio, regression))
+    return rows
+
+
+def _format(metric, value):
+    return f"{value * 1e3:10.3f} ms" if metric == 'time_best' else f"{value / 2**20:10.2f} MB"
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='KHPS2 calibration pipeline benchmark suite.')
+    parser.add_argument('--output', default='benchmark_results.json', help='Path of the JSON report.')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON report to compare against.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative slow-down reported as a regression (default 0.20 = 20 %%).')
+    parser.add_argument('--quick', action='store_true', help='Smaller specimen sets and grids.')
+    parser.add_argument('--stages', nargs='+', choices=('residual', 'solve', 'locus_grid', 'plotting'),
+                        help='Run only these stages.')
+    parser.add_argument('--repeat', type=int, help='Number of timed calls per case.')
+    args = parser.parse_args()
+
+    report = run_suite('quick' if args.quick else 'full', args.stages, args.repeat)
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+    for name, entry in report['results'].items():
+        print(f"{name:42s} {_format('time_best', entry['time_best'])} {_format('peak_memory', entry['peak_memory'])}")
+    print(f"Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            rows = compare(report, json.load(file), args.threshold)
+        print(f"\nComparison with {args.compare} (threshold {args.threshold:.0%})")
+        for name, metric, reference, current, ratio, regression in rows:
+            print(f"{name:42s} {metric:12s} {_format(metric, reference)} -> {_format(metric, current)} "
+                  f"{ratio:6.2f}x {'REGRESSION' if regression else ''}")
+        regressions = sum(row[-1] for row in rows)
+        print(f"{regressions} regression(s)")
+        sys.exit(1 if regressions else 0)
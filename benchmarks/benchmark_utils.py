@@ -0,0 +1,84 @@
+    # Library import
+import time
+import numpy as np
+    # Custom package import
+from package.Locus_calculation import locus_calculation
+
+    # Example calibration inputs (same values as in Main_Run_Function.ipynb)
+EXAMPLE_SPECIMEN_DATA = {"specimen1": [0.206, 0.583, 1],
+                         "specimen2": [0.153, 0.745, 1],
+                         "specimen3": [0.115, 0.917, 1],
+                         "specimen4": [0.154, 0.623, 0.031],
+                         "specimen5": [0.244, 0.001, 0.003],
+                         "specimen6": [0.133, 0.543, 0.279],
+                         "specimen7": [0.417, -0.295, -0.975],
+                         "specimen8": [0.588, -0.270, -0.942]}
+EXAMPLE_INITIAL_G = np.array([-0.15, 1.15, 2.12, 0.09, 0.94, 0.28])
+EXAMPLE_LOWER_BOUNDS = np.array([-1, 0, 0, 0, 0, 0])
+EXAMPLE_UPPER_BOUNDS = np.array([2, 2, 3, 2, 2, 2])
+EXAMPLE_OPTIMIZATION_OPTIONS = {'ftol': 1e-8, 'xtol': 1e-8, 'max_nfev': 10000, 'verbose': 0}
+EXAMPLE_DENOMINATOR_EPSILON = 1e-6
+EXAMPLE_Z_LIM = [0, 2.25]
+EXAMPLE_PLOTTING_OPTIONS = {
+    'figure_size': (13, 13.5), 'view_elev': 25, 'view_azim': 40,
+    'x_lim': [-3, 3], 'y_lim': [-1, 1], 'z_lim': EXAMPLE_Z_LIM,
+    'x_label': 'Stress triaxiality [-]', 'y_label': 'Normalized third invariant [-]',
+    'z_label': 'Fracture strain [-]', 'plot_title': 'KHPS2 fracture locus',
+    'labelpad_x': 15, 'labelpad_y': 15, 'labelpad_z': 1, 'title_y_position': 1.02,
+    'label_font_size': 13, 'title_font_size': 20,
+    'surface_alpha': 0.3, 'surface_rgb_color': np.array([0.3010, 0.7450, 0.9330]),
+    'plot_plane_stress_curve': True, 'plane_stress_line_color': 'k', 'plane_stress_line_width': 2,
+    'plot_constant_invariant_curves': True, 'constant_invariant_line_color': 'r', 'constant_invariant_line_width': 2,
+    'plot_approximated_points': True, 'marker_styles': ['o', 's', 'd', '^', 'o', 's', 'd', '^'],
+    'marker_size_area': 121,
+    'marker_face_colors': [[0, 0, 1], [0, 0.5, 0], [1, 0, 0], [0, 0.75, 0.75], [0.75, 0, 0.75],
+                           [0.6350, 0.0780, 0.1840], [0.9290, 0.6940, 0.1250], [0.8500, 0.3250, 0.0980]],
+    'marker_edge_color': 'k', 'marker_edge_linewidth': 1.5,
+    'plot_cut_off_plane': True, 'cut_off_plane_color': np.array([0.4940, 0.1840, 0.5560]), 'cut_off_plane_alpha': 0.5}
+
+    # Reference material parameters used to generate synthetic specimens
+REFERENCE_G = np.array([-0.10, 1.10, 2.00, 0.10, 0.90, 0.30])
+
+
+    # Synthetic specimen set generation
+def synthetic_specimen_data(n_specimens, G_params=REFERENCE_G, noise=0.02, seed=0):
+    """
+    Generates a synthetic specimen dictionary from a known KHPS2 locus.
+
+    Stress states are drawn uniformly from triaxiality [-1/3, 1] and normalized third
+    invariant [-1, 1], and only states in front of the cut-off plane with a positive,
+    finite fracture strain are kept. The fracture strains are perturbed by a relative
+    Gaussian noise of standard deviation 'noise'.
+
+    Returns a dictionary in the format:
+        {specimen_name: [Fracture strain, Stress triaxiality, Normalized third invariant]}
+    """
+    rng = np.random.default_rng(seed)
+    specimen_data = {}
+    while len(specimen_data) < n_specimens:
+        tri = rng.uniform(-1/3, 1, n_specimens)
+        invar = rng.uniform(-1, 1, n_specimens)
+        tri_c, ef = locus_calculation(G_params, tri, invar)
+        valid = (tri > tri_c + 0.05) & np.isfinite(ef) & (ef > 0) & (ef < 5)
+        for tri_i, invar_i, ef_i in zip(tri[valid], invar[valid], ef[valid]):
+            if len(specimen_data) == n_specimens:
+                break
+            ef_noisy = ef_i * (1 + noise * rng.standard_normal())
+            specimen_data[f"specimen{len(specimen_data) + 1}"] = [ef_noisy, tri_i, invar_i]
+    return specimen_data
+
+
+    # Repeated wall time measurement
+def time_call(function, repeat=5, number=1):
+    """
+    Returns the best wall time in seconds of 'number' consecutive calls of 'function'
+    over 'repeat' repetitions, together with the value of the last call.
+    """
+    best = np.inf
+    value = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            value = function()
+        best = min(best, time.perf_counter() - start)
+    return best, value
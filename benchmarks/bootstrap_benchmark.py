@@ -0,0 +1,31 @@
+    # Library import
+import os
+import time
+    # Custom package import
+from package.KHPS2_bootstrap import KHPS2_bootstrap
+from .adaptive_benchmark import EXAMPLE_FINAL_G
+from .benchmark_utils import (EXAMPLE_SPECIMEN_DATA, EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS,
+                              EXAMPLE_OPTIMIZATION_OPTIONS, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM)
+
+
+    # Bootstrap runtime for an increasing number of worker processes
+def run_benchmark(n_resamples=1000, worker_counts=None):
+    """
+    Runs a bootstrap of the example specimen set with an increasing number of workers and
+    returns a list of (workers, wall time, standard deviation of G1,... G6, failed fits).
+    """
+    worker_counts = worker_counts or sorted({1, os.cpu_count() or 1})
+    rows = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        results = KHPS2_bootstrap(EXAMPLE_SPECIMEN_DATA, EXAMPLE_FINAL_G, EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS,
+                                  EXAMPLE_OPTIMIZATION_OPTIONS, EXAMPLE_DENOMINATOR_EPSILON, n_resamples,
+                                  z_lim=EXAMPLE_Z_LIM, workers=workers, seed=0)
+        rows.append((workers, time.perf_counter() - start, results['G_std'], results['n_failed']))
+    return rows
+
+
+if __name__ == '__main__':
+    for workers, wall_time, G_std, failed in run_benchmark():
+        print(f"workers = {workers:>3}   time = {wall_time:6.2f} s   failed fits = {failed}   "
+              f"std(G1..G6) = {G_std.round(4)}")
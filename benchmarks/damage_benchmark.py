@@ -0,0 +1,52 @@
+    # Library import
+import os
+import tempfile
+import time
+import numpy as np
+    # Custom package import
+from package.KHPS2_damage import accumulate_damage, load_path_chunks
+from .adaptive_benchmark import EXAMPLE_FINAL_G
+
+
+    # Synthetic load path file - proportional loading with noisy stress states
+def write_load_paths(path, n_elements, n_increments, seed=0, increments_per_write=50):
+    """
+    Writes a (n_increments, n_elements, 3) .npy file of synthetic load paths
+    [equivalent plastic strain increment, stress triaxiality, normalized third invariant].
+    """
+    rng = np.random.default_rng(seed)
+    tri0 = rng.uniform(-0.2, 1.0, n_elements)
+    invar0 = rng.uniform(-1, 1, n_elements)
+    load_paths = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n_increments, n_elements, 3))
+    for start in range(0, n_increments, increments_per_write):
+        stop = min(start + increments_per_write, n_increments)
+        shape = (stop - start, n_elements)
+        load_paths[start:stop, :, 0] = rng.uniform(0, 2e-3, shape)
+        load_paths[start:stop, :, 1] = tri0 + rng.normal(0, 0.02, shape)
+        load_paths[start:stop, :, 2] = np.clip(invar0 + rng.normal(0, 0.02, shape), -1, 1)
+    load_paths.flush()
+
+
+    # Streaming damage accumulation throughput
+def run_benchmark(n_elements=200_000, n_increments=200, increments_per_chunk=16):
+    """
+    Streams a memory-mapped synthetic load path file through 'accumulate_damage' and returns
+    the wall time, the throughput in element increments per second and the number of
+    fractured elements.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'load_paths.npy')
+        write_load_paths(path, n_elements, n_increments)
+        start = time.perf_counter()
+        accumulator = accumulate_damage(load_path_chunks(path, increments_per_chunk), EXAMPLE_FINAL_G)
+        wall_time = time.perf_counter() - start
+        fractured = int(accumulator.fractured.sum())
+        del accumulator
+    return wall_time, n_elements * n_increments / wall_time, fractured
+
+
+if __name__ == '__main__':
+    wall_time, throughput, fractured = run_benchmark()
+    print(f"time = {wall_time:.2f} s   throughput = {throughput / 1e6:.1f} M element increments / s   "
+          f"fractured elements = {fractured}")
+    print(f"estimated time for 10^6 elements x 10^3 increments: {1e9 / throughput:.0f} s")
@@ -0,0 +1,52 @@
+    # Library import
+import subprocess
+import sys
+
+    # Modules whose import must not load a plotting backend
+COMPUTE_MODULES = ('package', 'package.Locus_calculation', 'package.KHPS2_calculation', 'package.KHPS2_batch',
+                   'package.KHPS2_multistart', 'package.KHPS2_locus', 'package.KHPS2_damage',
+                   'package.KHPS2_bootstrap', 'package.KHPS2_cache', 'package.KHPS2_session', 'package.Main_workflow')
+
+    # Plotting backends
+PLOTTING_MODULES = ('matplotlib', 'mpl_toolkits')
+
+    # Import timing in a fresh interpreter (nothing cached in sys.modules)
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, sum(name.split('.')[0] in {plotting} for name in sys.modules))
+"""
+
+
+def run_benchmark(modules=COMPUTE_MODULES + ('package.KHPS2_plotting',), repeat=5):
+    """
+    Imports each module 'repeat' times in fresh interpreters and returns rows
+    (module, best import time [s], number of loaded plotting modules).
+    """
+    rows = []
+    for module in modules:
+        times, n_plotting = [], 0
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, plotting=PLOTTING_MODULES)],
+                                    capture_output=True, text=True, check=True).stdout.split()
+            times.append(float(output[0]))
+            n_plotting = int(output[1])
+        rows.append((module, min(times), n_plotting))
+    return rows
+
+
+    # Regression guard - compute modules must not import matplotlib
+def check_lazy_imports(rows):
+    """Raises an AssertionError if one of the COMPUTE_MODULES rows loaded a plotting module."""
+    offending = [module for module, _, n_plotting in rows if module in COMPUTE_MODULES and n_plotting]
+    assert not offending, f"Plotting backend imported by: {', '.join(offending)}"
+
+
+if __name__ == '__main__':
+    rows = run_benchmark()
+    for module, seconds, n_plotting in rows:
+        print(f"{module:28s} {seconds * 1e3:8.1f} ms   plotting modules loaded: {n_plotting}")
+    check_lazy_imports(rows)
+    print("OK - no compute module imports matplotlib")
@@ -0,0 +1,73 @@
+    # Library import
+import sys
+import numpy as np
+from scipy.optimize import least_squares
+    # Custom package import
+from package.KHPS2_function import KHPS2_function, KHPS2_jacobian
+from .benchmark_utils import (EXAMPLE_SPECIMEN_DATA, EXAMPLE_INITIAL_G, EXAMPLE_LOWER_BOUNDS,
+                              EXAMPLE_UPPER_BOUNDS, EXAMPLE_OPTIMIZATION_OPTIONS,
+                              EXAMPLE_DENOMINATOR_EPSILON, synthetic_specimen_data, time_call)
+
+
+    # Accepted deviation of the analytic Jacobian, relative to max(1, |derivative|)
+JACOBIAN_TOLERANCE = 1e-6
+
+
+    # Finite difference check of the analytic Jacobian
+def check_jacobian(G_params, specimen_data, denominator_epsilon, step=1e-6):
+    """
+    Returns the largest difference between KHPS2_jacobian and a central finite difference
+    approximation of the KHPS2_function residual derivatives (step 'step' * max(1, |G|)),
+    relative to max(1, |derivative|). The central difference error is of order step**2.
+    """
+    G_params = np.asarray(G_params, dtype=float)
+    analytic = KHPS2_jacobian(G_params, specimen_data, denominator_epsilon)
+    numeric = np.empty_like(analytic)
+    for k in range(G_params.size):
+        h = step * max(1.0, abs(G_params[k]))
+        G_plus, G_minus = G_params.copy(), G_params.copy()
+        G_plus[k] += h
+        G_minus[k] -= h
+        numeric[:, k] = (KHPS2_function(G_plus, specimen_data, denominator_epsilon) -
+                         KHPS2_function(G_minus, specimen_data, denominator_epsilon)) / (2 * h)
+    return np.nanmax(np.abs(analytic - numeric) / np.maximum(1.0, np.abs(analytic)))
+
+
+    # Finite difference versus analytic Jacobian calibration run
+def run_benchmark(specimen_data, initial_G=EXAMPLE_INITIAL_G, repeat=5):
+    """
+    Calibrates the same specimen set with the finite difference and the analytic Jacobian
+    and returns a dictionary with the number of residual evaluations, wall times and costs.
+    """
+    results = {}
+    for label, jac in (('finite_difference', '2-point'),
+                       ('analytic', lambda G: KHPS2_jacobian(G, specimen_data, EXAMPLE_DENOMINATOR_EPSILON))):
+        wall_time, result = time_call(
+            lambda: least_squares(lambda G: KHPS2_function(G, specimen_data, EXAMPLE_DENOMINATOR_EPSILON),
+                                  initial_G, jac=jac, bounds=(EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS),
+                                  **EXAMPLE_OPTIMIZATION_OPTIONS), repeat=repeat)
+        # Finite difference Jacobians cost 6 extra residual evaluations per Jacobian evaluation
+        total_evaluations = result.nfev + (6 * result.njev if label == 'finite_difference' else 0)
+        results[label] = {'nfev': int(result.nfev), 'njev': int(result.njev),
+                          'residual_evaluations': int(total_evaluations),
+                          'wall_time': wall_time, 'cost': float(result.cost)}
+    return results
+
+
+if __name__ == '__main__':
+    deviation = check_jacobian(EXAMPLE_INITIAL_G, EXAMPLE_SPECIMEN_DATA, EXAMPLE_DENOMINATOR_EPSILON)
+    print(f"Max relative |analytic - central difference| at initial G: {deviation:.3e} "
+          f"(tolerance {JACOBIAN_TOLERANCE:.0e})")
+    if not deviation <= JACOBIAN_TOLERANCE:
+        print("FAILED - the analytic Jacobian does not match the finite differences")
+        sys.exit(1)
+    for name, data in (('example (8 specimens)', EXAMPLE_SPECIMEN_DATA),
+                       ('synthetic (50 specimens)', synthetic_specimen_data(50))):
+        results = run_benchmark(data)
+        fd, an = results['finite_difference'], results['analytic']
+        print(f"\n{name}")
+        for label, entry in results.items():
+            print(f"  {label:<18} evaluations = {entry['residual_evaluations']:>5}   "
+                  f"time = {entry['wall_time'] * 1e3:8.2f} ms   cost = {entry['cost']:.6e}")
+        print(f"  speed-up = {fd['wall_time'] / an['wall_time']:.2f}x   "
+              f"evaluations saved = {fd['residual_evaluations'] - an['residual_evaluations']}")
@@ -0,0 +1,46 @@
+    # Library import
+import time
+import numpy as np
+    # Custom package import
+from package.KHPS2_locus import KHPS2Locus
+from package.Locus_calculation import locus_calculation
+from .adaptive_benchmark import EXAMPLE_FINAL_G
+
+
+    # Large batch evaluation of a calibrated locus
+def run_benchmark(n_points=2_000_000, tolerance=1e-4, seed=0):
+    """
+    Evaluates 'n_points' random stress states with 'locus_calculation', the exact chunked
+    KHPS2Locus evaluation and the tabulated KHPS2Locus, and returns the wall time, the
+    largest deviation from 'locus_calculation' and the number of NaN mismatches of each.
+    """
+    rng = np.random.default_rng(seed)
+    tri = rng.uniform(-1, 2, n_points)
+    invar = rng.uniform(-1, 1, n_points)
+    start = time.perf_counter()
+    _, reference = locus_calculation(EXAMPLE_FINAL_G, tri, invar)
+    rows = [('locus_calculation', time.perf_counter() - start, 0.0, 0)]
+    locus = KHPS2Locus(EXAMPLE_FINAL_G)
+    output = np.empty(n_points)
+    start = time.perf_counter()
+    locus.evaluate(tri, invar, out=output)
+    rows.append(('KHPS2Locus.evaluate', time.perf_counter() - start) + _deviation(output, reference))
+    start = time.perf_counter()
+    locus.tabulate(tolerance)
+    table_time = time.perf_counter() - start
+    start = time.perf_counter()
+    locus(tri, invar, out=output)
+    rows.append((f"KHPS2Locus table ({locus.table['resolution']}^2, build {table_time:.2f} s)",
+                 time.perf_counter() - start) + _deviation(output, reference))
+    return rows
+
+
+    # Largest absolute deviation (on finite values) and NaN mismatch count
+def _deviation(values, reference):
+    finite = np.isfinite(values) & np.isfinite(reference)
+    return float(np.max(np.abs(values[finite] - reference[finite]))), int(np.sum(np.isnan(values) != np.isnan(reference)))
+
+
+if __name__ == '__main__':
+    for label, wall_time, deviation, mismatch in run_benchmark():
+        print(f"{label:<46} time = {wall_time * 1e3:8.1f} ms   max deviation = {deviation:.2e}   NaN mismatches = {mismatch}")
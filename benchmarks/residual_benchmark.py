@@ -0,0 +1,36 @@
+    # Library import
+import numpy as np
+    # Custom package import
+from package.KHPS2_function import KHPS2_function, KHPS2_jacobian
+from package.KHPS2_residual import KHPS2Residual
+from .benchmark_utils import EXAMPLE_INITIAL_G, EXAMPLE_DENOMINATOR_EPSILON, synthetic_specimen_data, time_call
+
+
+    # Per-call comparison of KHPS2_function and the packed KHPS2Residual evaluator
+def run_benchmark(n_specimens, number=2000, repeat=5):
+    """
+    Returns the per-call times (seconds) of the dictionary based and the packed residual
+    and Jacobian evaluations for a synthetic set of 'n_specimens', and the largest
+    absolute deviation between both implementations.
+    """
+    specimen_data = synthetic_specimen_data(n_specimens)
+    residual = KHPS2Residual(specimen_data, EXAMPLE_DENOMINATOR_EPSILON)
+    G = EXAMPLE_INITIAL_G
+    deviation = max(np.nanmax(np.abs(residual.residuals(G) - KHPS2_function(G, specimen_data, EXAMPLE_DENOMINATOR_EPSILON))),
+                    np.nanmax(np.abs(residual.jacobian(G) - KHPS2_jacobian(G, specimen_data, EXAMPLE_DENOMINATOR_EPSILON))))
+    timings = {
+        'KHPS2_function': time_call(lambda: KHPS2_function(G, specimen_data, EXAMPLE_DENOMINATOR_EPSILON), repeat, number)[0],
+        'KHPS2Residual.residuals': time_call(lambda: residual.residuals(G), repeat, number)[0],
+        'KHPS2_jacobian': time_call(lambda: KHPS2_jacobian(G, specimen_data, EXAMPLE_DENOMINATOR_EPSILON), repeat, number)[0],
+        'KHPS2Residual.jacobian': time_call(lambda: residual.jacobian(G), repeat, number)[0]}
+    return {label: value / number for label, value in timings.items()}, deviation
+
+
+if __name__ == '__main__':
+    for n_specimens in (8, 100, 10000):
+        timings, deviation = run_benchmark(n_specimens, number=2000 if n_specimens < 10000 else 200)
+        print(f"\n{n_specimens} specimens   (max deviation = {deviation:.2e})")
+        for label, per_call in timings.items():
+            print(f"  {label:<24} {per_call * 1e6:10.2f} us / call")
+        print(f"  residual speed-up = {timings['KHPS2_function'] / timings['KHPS2Residual.residuals']:.1f}x   "
+              f"jacobian speed-up = {timings['KHPS2_jacobian'] / timings['KHPS2Residual.jacobian']:.1f}x")
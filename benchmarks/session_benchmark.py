@@ -0,0 +1,46 @@
+    # Library import
+import time
+    # Custom package import
+from package.KHPS2_calculation import KHPS2_optimization
+from package.KHPS2_session import KHPS2CalibrationSession
+from .benchmark_utils import (EXAMPLE_INITIAL_G, EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS,
+                              EXAMPLE_OPTIMIZATION_OPTIONS, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM,
+                              synthetic_specimen_data)
+
+
+    # Specimens added one at a time - warm-started versus cold-started recalibration
+def run_benchmark(n_initial=10, n_added=20, seed=0):
+    """
+    Starts a session on 'n_initial' synthetic specimens, adds 'n_added' more one by one and
+    returns rows (n_specimens, warm nfev, cold nfev, warm time [s], cold time [s], cost difference).
+    The evaluation counts are residual evaluations (finite difference steps included).
+    """
+    specimen_data = synthetic_specimen_data(n_initial + n_added, seed=seed)
+    names = list(specimen_data)
+    session = KHPS2CalibrationSession({name: specimen_data[name] for name in names[:n_initial]},
+                                      EXAMPLE_INITIAL_G, EXAMPLE_LOWER_BOUNDS, EXAMPLE_UPPER_BOUNDS,
+                                      EXAMPLE_OPTIMIZATION_OPTIONS, EXAMPLE_DENOMINATOR_EPSILON, EXAMPLE_Z_LIM,
+                                      analytic_jacobian=True)
+    rows = []
+    for name in names[n_initial:]:
+        session.add_specimen(name, specimen_data[name], recalibrate=False)
+        start = time.perf_counter()
+        warm = session.recalibrate()
+        warm_time = time.perf_counter() - start
+        start = time.perf_counter()
+        cold, cold_residual = KHPS2_optimization(session.specimen_data, EXAMPLE_INITIAL_G, EXAMPLE_LOWER_BOUNDS,
+                                     EXAMPLE_UPPER_BOUNDS, EXAMPLE_OPTIMIZATION_OPTIONS,
+                                     EXAMPLE_DENOMINATOR_EPSILON, analytic_jacobian=True)
+        cold_time = time.perf_counter() - start
+        rows.append((warm['n_specimens'], warm['nfev'], cold_residual.n_residual_evaluations, warm_time, cold_time,
+                     warm['cost'] - cold.cost))
+    return rows
+
+
+if __name__ == '__main__':
+    rows = run_benchmark()
+    print(f"{'specimens':>9} {'warm nfev':>10} {'cold nfev':>10} {'warm ms':>9} {'cold ms':>9} {'cost diff':>11}")
+    for n, warm_nfev, cold_nfev, warm_time, cold_time, cost_difference in rows:
+        print(f"{n:>9} {warm_nfev:>10} {cold_nfev:>10} {warm_time * 1e3:>9.2f} {cold_time * 1e3:>9.2f} "
+              f"{cost_difference:>11.2e}")
+    print(f"total nfev: warm = {sum(row[1] for row in rows)}, cold = {sum(row[2] for row in rows)}")
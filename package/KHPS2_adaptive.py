@@ -0,0 +1,234 @@
+    # Library import
+import warnings
+import numpy as np
+
+    # Custom package import
+from .Locus_calculation import locus_calculation
+from .KHPS2_result import DEFAULT_LOCUS_OPTIONS
+
+
+    # Adaptive KHPS2 locus mesh
+class AdaptiveLocusMesh:
+    """
+    Quadtree mesh of the KHPS2 fracture locus produced by 'adaptive_locus_surface'.
+
+    All cell corners lie on a fine integer lattice of (n_cells + 1) x (n_cells + 1) vertices
+    spanning 'tri_range' x 'invar_range', where n_cells = initial_divisions * 2**max_depth.
+    Neighbouring leaves may differ in size by more than one level and the mesh is not
+    balanced: a vertex in the middle of a larger neighbour's edge (hanging node) leaves a
+    small crack in the triangulated surface. Its width is the deviation of that edge from the
+    exact locus, which is below the tolerance at the checked edge midpoint.
+
+    Attributes:
+        tri, invar, ef: 1D arrays of the evaluated vertices (stress triaxiality, normalized
+            third invariant, fracture strain - NaN where the locus is suppressed).
+        triangles: (n, 3) integer array of vertex indices of the finite surface triangles
+            (two per leaf cell), usable with 'matplotlib' plot_trisurf.
+        cells: (n, 3) integer array of the leaf cells [i0, j0, size] in lattice units.
+        n_evaluations: Number of locus evaluations used to build the mesh.
+        max_error: Largest interpolation error of the leaf cells at their checked points
+            (center and edge midpoints, where both values are finite).
+        unresolved_cells: (n, 3) integer array of the finest leaf cells whose error still
+            exceeds the tolerance (max_depth too small).
+        tri_range, invar_range, n_cells: Lattice definition.
+    """
+
+    def __init__(self, vertex_ids, ef, cells, n_cells, tri_range, invar_range, n_evaluations,
+                 max_error=0.0, unresolved_cells=None):
+        self.n_cells = n_cells
+        self.tri_range = tri_range
+        self.invar_range = invar_range
+        self.cells = cells
+        self.n_evaluations = n_evaluations
+        self.max_error = max_error
+        self.unresolved_cells = np.zeros((0, 3), dtype=int) if unresolved_cells is None else unresolved_cells
+
+        # Vertices used by the leaf cells, in lattice order
+        self._vertex_ids = vertex_ids
+        i, j = np.divmod(vertex_ids, n_cells + 1)
+        self.tri, self.invar = self._coordinates(i, j)
+        self.ef = ef
+
+        # Two triangles per leaf cell, kept only if all three vertices carry a finite fracture strain
+        i0, j0, size = cells.T
+        corners = [np.searchsorted(vertex_ids, (i0 + di * size) * (n_cells + 1) + (j0 + dj * size))
+                   for di, dj in ((0, 0), (1, 0), (1, 1), (0, 1))]
+        triangles = np.concatenate([np.column_stack([corners[0], corners[1], corners[2]]),
+                                    np.column_stack([corners[0], corners[2], corners[3]])])
+        self.triangles = triangles[np.all(np.isfinite(ef[triangles]), axis=1)]
+        self._leaf_lookup = None
+
+    def _coordinates(self, i, j):
+        tri = self.tri_range[0] + i * (self.tri_range[1] - self.tri_range[0]) / self.n_cells
+        invar = self.invar_range[0] + j * (self.invar_range[1] - self.invar_range[0]) / self.n_cells
+        return tri, invar
+
+    def interpolate(self, tri_values, invar_values):
+        """
+        Bilinear interpolation of the fracture strain inside the leaf cells of the mesh.
+        Returns NaN outside the mesh ranges and in cells with a suppressed corner.
+        """
+        n = self.n_cells
+        if self._leaf_lookup is None:
+            # Sorted lattice ids of the leaf origins, per leaf size (no n x n lattice array)
+            self._leaf_lookup = []
+            origins = self.cells[:, 0] * (n + 1) + self.cells[:, 1]
+            for size in np.unique(self.cells[:, 2]):
+                leaves = np.flatnonzero(self.cells[:, 2] == size)
+                order = np.argsort(origins[leaves])
+                self._leaf_lookup.append((size, origins[leaves][order], leaves[order]))
+        x = (np.asarray(tri_values, dtype=float) - self.tri_range[0]) / (self.tri_range[1] - self.tri_range[0]) * n
+        y = (np.asarray(invar_values, dtype=float) - self.invar_range[0]) / (self.invar_range[1] - self.invar_range[0]) * n
+        inside = (x >= 0) & (x <= n) & (y >= 0) & (y <= n)
+        leaf = np.full(x.shape, -1, dtype=np.int64)
+        i = np.minimum(x[inside], n - 1).astype(np.int64)
+        j = np.minimum(y[inside], n - 1).astype(np.int64)
+        found = np.full(i.shape, -1, dtype=np.int64)
+        for size, origin_ids, leaves in self._leaf_lookup:
+            # Origin of the cell of this size containing the point, looked up among the leaves of this size
+            candidate = (i // size * size) * (n + 1) + j // size * size
+            position = np.minimum(np.searchsorted(origin_ids, candidate), origin_ids.size - 1)
+            match = origin_ids[position] == candidate
+            found[match] = leaves[position[match]]
+        leaf[inside] = found
+        result = np.full(x.shape, np.nan)
+        valid = leaf >= 0
+        i0, j0, size = self.cells[leaf[valid]].T
+        u = (x[valid] - i0) / size
+        v = (y[valid] - j0) / size
+        corner = lambda di, dj: self.ef[np.searchsorted(self._vertex_ids, (i0 + di * size) * (n + 1) + (j0 + dj * size))]
+        result[valid] = ((1 - u) * (1 - v) * corner(0, 0) + u * (1 - v) * corner(1, 0) +
+                         u * v * corner(1, 1) + (1 - u) * v * corner(0, 1))
+        return result
+
+
+    # Adaptive KHPS2 locus surface generation function
+def adaptive_locus_surface(G_params, denominator_epsilon, z_lim, tolerance=1e-3, locus_options=None,
+                           initial_divisions=16, max_depth=9):
+    """
+    Generates the KHPS2 locus surface on an adaptively refined quadtree mesh.
+
+    The (triaxiality, invariant) domain is first split into initial_divisions x initial_divisions
+    cells. A cell is split into four children when the bilinear interpolation of its corners
+    differs by more than 'tolerance' from the exact fracture strain at the cell center or at
+    one of its edge midpoints, or when some of these points are suppressed (NaN behind the
+    cut-off plane, below 0 or above z_lim[1]) and others are not - i.e. along the cut-off
+    plane and the other boundaries of the visible locus. Cells with all points suppressed
+    are dropped. Cells of the finest size are checked as well (their midpoints lie between
+    the lattice vertices) but not refined: the ones still exceeding the tolerance are returned
+    as 'unresolved_cells' with a RuntimeWarning, so 'max_depth' has to be large enough for
+    steep regions next to the cut-off plane. The mesh is not 2:1 balanced (see
+    'AdaptiveLocusMesh'). Each refinement level is evaluated in one vectorized
+    'locus_calculation' call, and every lattice vertex is evaluated only once.
+
+    Function execution:
+        mesh = adaptive_locus_surface(G_params, denominator_epsilon, z_lim, tolerance=1e-3, locus_options=None,
+                                      initial_divisions=16, max_depth=9)
+
+    Function's input args:
+        G_params: A 1D NumPy array of material parameters [G1, G2, G3, G4, G5, G6].
+        denominator_epsilon: Numerical stability constant of 'locus_calculation'.
+        z_lim: A list [min_z, max_z]. Fracture strains above 'max_z' are suppressed.
+        tolerance: Maximum accepted interpolation error of the fracture strain.
+        locus_options: Dictionary with the 'tri_range' and 'invar_range' of the surface
+            (defaults in 'DEFAULT_LOCUS_OPTIONS').
+        initial_divisions: Number of initial cells per axis.
+        max_depth: Maximum number of refinements of an initial cell. The finest cells have
+            the size of a (initial_divisions * 2**max_depth) uniform grid. Cells along the
+            boundaries of the visible locus are always refined down to this size, so it
+            drives the number of evaluations. The default 9 meets the default tolerance on
+            the example calibration of the repository (see benchmarks/adaptive_benchmark.py).
+
+    Function's return args:
+        An 'AdaptiveLocusMesh' object, with the achieved 'max_error' and the 'unresolved_cells'.
+    """
+    locus_options = {**DEFAULT_LOCUS_OPTIONS, **(locus_options or {})}
+    tri_range, invar_range = locus_options['tri_range'], locus_options['invar_range']
+    n_cells = initial_divisions * 2**max_depth
+    stride = n_cells + 1
+    known_ids = np.zeros(0, dtype=np.int64)
+    known_ef = np.zeros(0)
+
+    # Fracture strain at (fractional) lattice coordinates - same suppression as the dense locus grid
+    def locus(i, j):
+        tri = tri_range[0] + i * (tri_range[1] - tri_range[0]) / n_cells
+        invar = invar_range[0] + j * (invar_range[1] - invar_range[0]) / n_cells
+        tri_c, ef = locus_calculation(G_params, tri, invar, denominator_epsilon)
+        ef[(tri < tri_c) | (ef < 0) | (ef > z_lim[1])] = np.nan
+        return ef
+
+    # Vectorized evaluation of the lattice vertices which are not known yet
+    def evaluate(vertex_ids):
+        nonlocal known_ids, known_ef
+        new_ids = np.setdiff1d(vertex_ids.ravel(), known_ids)
+        if new_ids.size:
+            ef = locus(*np.divmod(new_ids, stride))
+            known_ids = np.concatenate([known_ids, new_ids])
+            known_ef = np.concatenate([known_ef, ef])
+            order = np.argsort(known_ids)
+            known_ids, known_ef = known_ids[order], known_ef[order]
+        return known_ef[np.searchsorted(known_ids, vertex_ids)]
+
+    # Initial cells
+    size = 2**max_depth
+    i0, j0 = np.meshgrid(np.arange(initial_divisions) * size, np.arange(initial_divisions) * size, indexing='ij')
+    cells = np.column_stack([i0.ravel(), j0.ravel(), np.full(i0.size, size)])
+    leaves = []
+    unresolved = np.zeros((0, 3), dtype=int)
+    max_error = 0.0
+    n_midpoint_evaluations = 0
+
+    while cells.size:
+        i0, j0, size = cells.T
+        corners = evaluate(np.stack([(i0 + di * size) * stride + (j0 + dj * size)
+                                     for di, dj in ((0, 0), (1, 0), (1, 1), (0, 1))], axis=1))
+        midpoints = ((1, 1), (1, 0), (2, 1), (1, 2), (0, 1))       # Center and edge midpoints in half cell sizes
+        if size[0] > 1:
+            half = size // 2
+            exact = evaluate(np.stack([(i0 + di * half) * stride + (j0 + dj * half) for di, dj in midpoints], axis=1))
+        else:
+            # Finest level - the midpoints lie on a lattice of half spacing, shared edge midpoints are evaluated once
+            half_ids = np.stack([(2 * i0 + di) * (2 * stride) + (2 * j0 + dj) for di, dj in midpoints], axis=1)
+            unique_ids, inverse = np.unique(half_ids, return_inverse=True)
+            i_half, j_half = np.divmod(unique_ids, 2 * stride)
+            exact = locus(i_half / 2, j_half / 2)[inverse].reshape(half_ids.shape)
+            n_midpoint_evaluations += unique_ids.size
+        c00, c10, c11, c01 = corners.T
+
+        # Exact values at the cell center and edge midpoints versus the bilinear interpolation of the corners
+        interpolated = np.column_stack([(c00 + c10 + c11 + c01) / 4, (c00 + c10) / 2,
+                                        (c10 + c11) / 2, (c11 + c01) / 2, (c01 + c00) / 2])
+        finite = np.isfinite(np.column_stack([corners, exact]))
+        all_suppressed = ~np.any(finite, axis=1)
+        mixed = np.any(finite, axis=1) & ~np.all(finite, axis=1)
+        comparable = finite[:, 4:] & np.isfinite(interpolated)
+        error = np.max(np.abs(np.where(comparable, exact - interpolated, 0)), axis=1)
+        inaccurate = error > tolerance
+        if size[0] == 1:
+            # Finest level - keep every cell with at least one finite corner, report the inaccurate ones
+            keep = np.any(np.isfinite(corners), axis=1)
+            unresolved = cells[keep & inaccurate]
+            leaves.append(cells[keep])
+            max_error = max(max_error, float(np.max(error[keep], initial=0.0)))
+            break
+        refine = (mixed | inaccurate) & ~all_suppressed
+        leaves.append(cells[~refine & ~all_suppressed])
+        max_error = max(max_error, float(np.max(error[~refine & ~all_suppressed], initial=0.0)))
+
+        # Four children of every refined cell
+        parents = cells[refine]
+        h = parents[:, 2] // 2
+        cells = np.concatenate([np.column_stack([parents[:, 0] + di * h, parents[:, 1] + dj * h, h])
+                                for di in (0, 1) for dj in (0, 1)])
+
+    leaves = np.concatenate(leaves) if leaves else np.zeros((0, 3), dtype=int)
+    if unresolved.size:
+        warnings.warn(f"{len(unresolved)} finest cells exceed the tolerance {tolerance:g} "
+                      f"(max error {max_error:.3g}), increase 'max_depth'.", RuntimeWarning)
+
+    # Vertices used by the leaf cells
+    i0, j0, size = leaves.T
+    vertex_ids = np.unique(np.concatenate([(i0 + di * size) * stride + (j0 + dj * size)
+                                           for di in (0, 1) for dj in (0, 1)]))
+    return AdaptiveLocusMesh(vertex_ids, evaluate(vertex_ids), leaves, n_cells, tri_range, invar_range,
+                             known_ids.size + n_midpoint_evaluations, max_error, unresolved)
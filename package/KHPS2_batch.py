@@ -0,0 +1,136 @@
+    # Standard library import
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+
+    # Custom package import
+from .KHPS2_calculation import KHPS2_optimization, KHPS2_calibration_error
+
+    # Structured record of one calibrated material
+CALIBRATION_DTYPE = np.dtype([
+    ('name', 'U64'),                        # Material / dataset name
+    ('G', 'f8', (6,)),                      # Calibrated material parameters G1,... G6
+    ('cost', 'f8'),                         # Final least squares cost (0.5 * sum of squared residuals)
+    ('nfev', 'i8'),                         # Number of residual evaluations
+    ('njev', 'i8'),                         # Number of Jacobian evaluations
+    ('status', 'i8'),                       # least_squares termination status
+    ('success', '?'),                       # True if the optimizer converged and no error occurred
+    ('total_abs_difference', 'f8'),         # Sum of absolute residuals
+    ('pt_calibration_error', 'f8'),         # Total percentage calibration error
+    ('max_p_calibration_error', 'f8'),      # Largest percentage calibration error of a single specimen
+    ('n_residual_evaluations', 'i8'),       # Residual evaluations including finite difference steps
+    ('wall_time', 'f8'),                    # Wall time of the calibration [s]
+    ('error', 'U256')])                     # Exception message of a failed calibration, empty otherwise
+
+
+    # Single material calibration - optimization stage only (module level, so it can be sent to worker processes)
+def _calibrate_material(task):
+    name, specimen_data, initial_G, lower_bounds, upper_bounds, \
+        optimization_options, denominator_epsilon, analytic_jacobian = task
+    record = np.zeros((), dtype=CALIBRATION_DTYPE)
+    record['name'] = name
+    start = time.perf_counter()
+    try:
+        result, residual = KHPS2_optimization(specimen_data, initial_G, lower_bounds, upper_bounds,
+                                              optimization_options, denominator_epsilon, analytic_jacobian)
+        ef_r, total_abs_difference, p_calibration_error, pt_calibration_error = KHPS2_calibration_error(
+            result.x, residual.ef_k, residual.tri_k, residual.invar_k, denominator_epsilon)
+        record['G'] = result.x
+        record['cost'] = result.cost
+        record['nfev'] = result.nfev
+        record['njev'] = result.njev if result.njev is not None else 0
+        record['status'] = result.status
+        record['success'] = result.success
+        record['total_abs_difference'] = total_abs_difference
+        record['pt_calibration_error'] = pt_calibration_error
+        record['max_p_calibration_error'] = np.max(p_calibration_error)
+        record['n_residual_evaluations'] = residual.n_residual_evaluations
+    except Exception as exc:        # Per-material failure - reported in the record, the batch continues
+        _mark_failed(record, f"{type(exc).__name__}: {exc}")
+    record['wall_time'] = time.perf_counter() - start
+    return record
+
+
+    # Failed record filling
+def _mark_failed(record, message):
+    record['G'] = np.nan
+    for field in ('cost', 'total_abs_difference', 'pt_calibration_error', 'max_p_calibration_error', 'wall_time'):
+        record[field] = np.nan
+    record['status'] = -1
+    record['success'] = False
+    record['error'] = message[:256]
+
+
+    # Batch calibration function
+def calibrate_many(datasets, initial_G, lower_bounds, upper_bounds, optimization_options,
+                   denominator_epsilon=1e-6, analytic_jacobian=False, workers=None, chunksize=None):
+    """
+    Calibrates the KHPS2 material parameters of many materials in parallel.
+
+    Only the optimization stage and the calibration error evaluation of 'KHPS2_calculation'
+    are run - no locus grid or plane stress curve is built. The materials are distributed
+    over a pool of worker processes, each calibration being independent of the others.
+    A failure of one material (an exception in the optimizer, invalid data, ...) is
+    reported in its record and does not stop the rest of the batch.
+
+    Function execution:
+        records = calibrate_many(datasets, initial_G, lower_bounds, upper_bounds, optimization_options,
+                                 denominator_epsilon=1e-6, analytic_jacobian=False, workers=None, chunksize=None)
+
+    Function's input args:
+        datasets: Either a dictionary {material_name: specimen_data} or a sequence of
+            specimen_data dictionaries (named "material1", "material2", ... in order).
+            Each specimen_data has the format:
+                {specimen_name: [Fracture strain, Stress triaxiality, Normalized third invariant]}.
+        initial_G, lower_bounds, upper_bounds, optimization_options, denominator_epsilon,
+        analytic_jacobian: Same meaning as in 'KHPS2_calculation', shared by all materials.
+            'optimization_options' should use 'verbose': 0, otherwise every worker prints.
+        workers: Number of worker processes. Default (None) uses all CPU cores,
+            1 runs the batch sequentially in the calling process.
+        chunksize: Number of materials sent to a worker at once. Default (None) splits
+            the batch into about 4 chunks per worker, which keeps the inter-process
+            overhead low for short calibrations.
+
+    Function's return args:
+        A 1D NumPy structured array with one record per material (in input order) and
+        the fields described by 'CALIBRATION_DTYPE':
+            name, G (G1,... G6), cost, nfev, njev, status, success,
+            total_abs_difference, pt_calibration_error, max_p_calibration_error,
+            n_residual_evaluations, wall_time, error.
+    """
+
+    # Dataset naming
+    if isinstance(datasets, dict):
+        names, specimen_sets = list(datasets.keys()), list(datasets.values())
+    else:
+        specimen_sets = list(datasets)
+        names = [f"material{i + 1}" for i in range(len(specimen_sets))]
+    tasks = [(str(name), specimen_data, initial_G, lower_bounds, upper_bounds,
+              optimization_options, denominator_epsilon, analytic_jacobian)
+             for name, specimen_data in zip(names, specimen_sets)]
+    records = np.zeros(len(tasks), dtype=CALIBRATION_DTYPE)
+
+    # Sequential execution
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        for i, task in enumerate(tasks):
+            records[i] = _calibrate_material(task)
+        return records
+
+    # Parallel execution over a process pool
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (4 * workers))
+    completed = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for record in executor.map(_calibrate_material, tasks, chunksize=chunksize):
+                records[completed] = record
+                completed += 1
+    except BrokenProcessPool as exc:        # A worker died (e.g. out of memory) - remaining materials are marked as failed
+        for i in range(completed, len(tasks)):
+            records[i]['name'] = tasks[i][0]
+            _mark_failed(records[i], f"BrokenProcessPool: {exc}")
+    return records
@@ -0,0 +1,148 @@
+    # Standard library import
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+    # Custom package import
+from .KHPS2_calculation import KHPS2_optimization
+from .KHPS2_residual import KHPS2Residual
+from .KHPS2_result import plane_stress_curve
+
+
+    # Fit of a batch of resampled specimen sets (module level, so it can be sent to worker processes)
+def _fit_resamples(task):
+    specimens, resamples, initial_G, lower_bounds, upper_bounds, \
+        optimization_options, denominator_epsilon, analytic_jacobian = task
+    samples = np.full((len(resamples), 6), np.nan)
+    for row, indices in enumerate(resamples):
+        residual = KHPS2Residual.from_arrays(*specimens[:, indices], denominator_epsilon)
+        try:
+            result, _ = KHPS2_optimization(residual, initial_G, lower_bounds, upper_bounds,
+                                           optimization_options, denominator_epsilon, analytic_jacobian)
+            samples[row] = result.x
+        except Exception:       # Degenerate resample (e.g. non-finite residuals) - left as NaN
+            pass
+    return samples
+
+
+    # KHPS2 bootstrap / jackknife uncertainty quantification function
+def KHPS2_bootstrap(specimen_data, final_G_params, lower_bounds, upper_bounds, optimization_options,
+                    denominator_epsilon=1e-6, n_resamples=1000, method='bootstrap', percentiles=(2.5, 50, 97.5),
+                    z_lim=None, locus_options=None, workers=None, analytic_jacobian=True, seed=None):
+    """
+    Uncertainty of the calibrated KHPS2 parameters by bootstrap or jackknife resampling.
+
+    The least squares fit of 'KHPS2_calculation' is repeated on resampled specimen sets,
+    each fit being warm-started from the nominal solution 'final_G_params'. The resampled
+    fits are distributed in batches over a pool of worker processes.
+        - 'bootstrap': 'n_resamples' sets of n specimens drawn with replacement.
+        - 'jackknife': the n sets leaving out one specimen each ('n_resamples' is ignored).
+          The leave-one-out fits scatter about sqrt(n - 1) times less than the estimate, so
+          their deviations from the jackknife mean are scaled by sqrt(n - 1) before the
+          parameter and fracture strain percentiles are taken (spread matching 'covariance').
+          These are approximate uncertainty bands, not feasible parameter sets: they may lie
+          outside the parameter bounds. All n fits have to succeed, else a RuntimeError is raised.
+
+    Function execution:
+        results = KHPS2_bootstrap(specimen_data, final_G_params, lower_bounds, upper_bounds, optimization_options,
+                                  denominator_epsilon=1e-6, n_resamples=1000, method='bootstrap',
+                                  percentiles=(2.5, 50, 97.5), z_lim=None, locus_options=None, workers=None,
+                                  analytic_jacobian=True, seed=None)
+
+    Function's input args:
+        specimen_data, lower_bounds, upper_bounds, optimization_options, denominator_epsilon:
+            Same meaning as in 'KHPS2_calculation'. 'verbose' should be 0.
+        final_G_params: Nominal calibrated parameters [G1, G2, G3, G4, G5, G6].
+        n_resamples: Number of bootstrap resamples.
+        method: 'bootstrap' or 'jackknife'.
+        percentiles: Percentiles (0 - 100) of the parameter and fracture strain bands.
+        z_lim: A list [min_z, max_z] suppressing plane stress fracture strains above 'max_z'
+            (no upper suppression if None).
+        locus_options: Dictionary with the 'plane_stress_resolution' of the plane stress curve.
+        workers: Number of worker processes. Default (None) uses all CPU cores,
+            1 runs sequentially in the calling process.
+        analytic_jacobian: Use the closed-form Jacobian in the fits, True by default.
+        seed: Seed of the bootstrap resampling.
+
+    Function's returned value:
+        A dictionary containing:
+            - 'method': The resampling method.
+            - 'G_samples': 2D NumPy array (resamples, 6) of the refitted parameters (NaN rows for failed fits).
+            - 'G_mean', 'G_std': Mean and standard deviation of G1,... G6 over the resamples.
+            - 'covariance': 6 x 6 parameter covariance matrix (jackknife: (n - 1) / n times the
+              sum of the outer products of the deviations from the jackknife mean).
+            - 'G_percentiles': 2D NumPy array (len(percentiles), 6) of parameter percentiles
+              (jackknife: of the sqrt(n - 1) scaled samples, which may exceed the bounds).
+            - 'tri1', 'invar1': The plane stress curve (see 'plane_stress_curve').
+            - 'ef1_nominal': Plane stress fracture strain of the nominal parameters.
+            - 'ef1_percentiles': 2D NumPy array (len(percentiles), points) of fracture strain bands
+              (jackknife: of the sqrt(n - 1) scaled samples).
+            - 'n_failed': Number of failed resampled fits.
+    """
+
+    # Packed specimen arrays - rows: Fracture strain, Stress triaxiality, Normalized third invariant
+    specimens = np.ascontiguousarray(np.array(list(specimen_data.values()), dtype=float).T)
+    n_specimens = specimens.shape[1]
+    final_G_params = np.clip(final_G_params, lower_bounds, upper_bounds)
+
+    # Resampled specimen index sets
+    if method == 'bootstrap':
+        resamples = np.random.default_rng(seed).integers(0, n_specimens, (n_resamples, n_specimens))
+    elif method == 'jackknife':
+        resamples = np.array([np.delete(np.arange(n_specimens), i) for i in range(n_specimens)])
+    else:
+        raise ValueError(f"Unknown method '{method}', expected 'bootstrap' or 'jackknife'.")
+
+    # Warm-started refits, in batches over the worker processes
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    workers = max(1, min(workers, len(resamples)))
+    batches = np.array_split(resamples, workers * 4 if workers > 1 else 1)
+    tasks = [(specimens, batch, final_G_params, lower_bounds, upper_bounds, optimization_options,
+              denominator_epsilon, analytic_jacobian) for batch in batches if len(batch)]
+    if workers == 1:
+        G_samples = np.concatenate([_fit_resamples(task) for task in tasks])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            G_samples = np.concatenate(list(executor.map(_fit_resamples, tasks)))
+    fitted = G_samples[~np.isnan(G_samples).any(axis=1)]
+    if len(fitted) < 2:
+        raise RuntimeError(f"Only {len(fitted)} of {len(G_samples)} resampled fits succeeded.")
+    if method == 'jackknife' and len(fitted) < n_specimens:
+        # Without every leave-one-out fit, the (n - 1) / n and sqrt(n - 1) factors no longer apply
+        raise RuntimeError(f"{n_specimens - len(fitted)} of {n_specimens} leave-one-out fits failed, "
+                           f"the jackknife needs all of them.")
+
+    # Parameter statistics
+    if method == 'jackknife':
+        deviation = fitted - fitted.mean(axis=0)
+        covariance = (n_specimens - 1) / n_specimens * deviation.T @ deviation
+    else:
+        covariance = np.cov(fitted, rowvar=False)
+
+    # Fracture strain bands along the plane stress curve
+    z_lim = [0, np.inf] if z_lim is None else z_lim
+    tri1, invar1, ef1_nominal = plane_stress_curve(final_G_params, denominator_epsilon, z_lim, locus_options)
+    ef1_samples = np.array([plane_stress_curve(G, denominator_epsilon, z_lim, locus_options)[2] for G in fitted])
+    with warnings.catch_warnings():         # All-NaN points (suppressed for every resample) stay NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        G_bands = fitted
+        if method == 'jackknife':
+            # Leave-one-out deviations inflated to the jackknife spread
+            scale = np.sqrt(n_specimens - 1)
+            G_bands = fitted.mean(axis=0) + scale * (fitted - fitted.mean(axis=0))
+            ef1_samples = np.nanmean(ef1_samples, axis=0) + scale * (ef1_samples - np.nanmean(ef1_samples, axis=0))
+        ef1_percentiles = np.nanpercentile(ef1_samples, percentiles, axis=0)
+
+    return {
+        'method': method,                                                   # Resampling method
+        'G_samples': G_samples,                                             # Refitted parameters of all resamples
+        'G_mean': fitted.mean(axis=0),                                      # Mean of G1,... G6
+        'G_std': np.sqrt(np.diag(covariance)),                              # Standard deviation of G1,... G6
+        'covariance': covariance,                                           # Parameter covariance matrix
+        'G_percentiles': np.percentile(G_bands, percentiles, axis=0),       # Parameter percentiles
+        'tri1': tri1,                                                       # Plane stress triaxiality
+        'invar1': invar1,                                                   # Plane stress normalized third invariant
+        'ef1_nominal': ef1_nominal,                                         # Nominal plane stress fracture strain
+        'ef1_percentiles': ef1_percentiles,                                 # Plane stress fracture strain bands
+        'n_failed': int(len(G_samples) - len(fitted))}                      # Number of failed refits
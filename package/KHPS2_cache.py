@@ -0,0 +1,232 @@
+    # Standard library import
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+    # Custom package import
+from .KHPS2_calculation import KHPS2_calibration
+from .KHPS2_result import KHPS2Result, DEFAULT_LOCUS_OPTIONS
+
+    # Optimization options which do not change the calibrated parameters (excluded from the cache key)
+_NON_RESULT_OPTIONS = ('verbose',)
+
+
+    # Stable text form of option values for hashing
+def _canonical(value):
+    if isinstance(value, dict):
+        return {str(key): _canonical(value[key]) for key in sorted(value, key=str)}
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.dtype) or (isinstance(value, type) and issubclass(value, np.generic)):
+        return np.dtype(value).name         # e.g. the 'dtype' locus option
+    # e.g. callables - their repr is not stable across processes and their code cannot be hashed
+    raise TypeError(f"Option value {value!r} of type '{type(value).__name__}' cannot be part of a cache key.")
+
+
+    # Persistent KHPS2 calibration result cache
+class KHPS2Cache:
+    """
+    Content-addressed cache of KHPS2 calibration results.
+
+    Entries are keyed by a SHA-256 hash of the specimen data (names and values), initial_G,
+    the bounds, the optimization options (except 'verbose'), denominator_epsilon and the
+    Jacobian mode. Two tiers are used:
+        - memory: an LRU of at most 'max_memory_entries' 'KHPS2Result' objects (including
+          the locus geometry computed before caching). The cache keeps its own copies and
+          hands out copies, so changes to a returned result never reach the cache,
+        - disk (if 'directory' is given): one .npz file per entry, evicted by least recent
+          use once the directory exceeds 'max_disk_bytes'.
+    With 'store_locus', the locus surface and plane stress curve are saved to disk as well
+    and reused when z_lim and locus_options match; otherwise they are recalculated lazily.
+    Calibrations with option values that have no stable text form (e.g. a callable 'loss'
+    or 'jac') are run but never cached.
+
+    Object creation:
+        cache = KHPS2Cache(directory=None, max_memory_entries=32, max_disk_bytes=512 * 2**20, store_locus=False)
+
+    Usage:
+        result = cache.calibrate(specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                                 denominator_epsilon, z_lim, refresh=False)
+        cache.invalidate()          # Drops all entries (memory and disk)
+    """
+
+    def __init__(self, directory=None, max_memory_entries=32, max_disk_bytes=512 * 2**20, store_locus=False):
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.store_locus = store_locus
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+            denominator_epsilon, analytic_jacobian=False):
+        """
+        Returns the hexadecimal cache key of a calibration input. Raises a TypeError if an
+        option value (e.g. a callable) cannot be hashed reproducibly.
+        """
+        options = {name: value for name, value in optimization_options.items() if name not in _NON_RESULT_OPTIONS}
+        digest = hashlib.sha256()
+        digest.update(json.dumps(_canonical(list(specimen_data.keys()))).encode())
+        digest.update(np.ascontiguousarray(np.array(list(specimen_data.values()), dtype=float)).tobytes())
+        for array in (initial_G, lower_bounds, upper_bounds):
+            digest.update(np.ascontiguousarray(np.asarray(array, dtype=float)).tobytes())
+        digest.update(json.dumps(_canonical([options, float(denominator_epsilon), bool(analytic_jacobian)])).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _temporary_path(self, key):
+        return os.path.join(self.directory, f"{key}.tmp")
+
+    def get(self, key):
+        """Returns a copy of the cached 'KHPS2Result' of 'key' (memory first, then disk) or None."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self._touch(key)
+            self.hits += 1
+            return copy.deepcopy(self._memory[key])
+        if self.directory is not None and os.path.exists(self._path(key)):
+            result = self._load(key)
+            self._touch(key)
+            self._remember(key, result)
+            self.hits += 1
+            return copy.deepcopy(result)
+        self.misses += 1
+        return None
+
+    def put(self, key, result):
+        """Stores a copy of a 'KHPS2Result' under 'key' in memory and, if a directory is set, on disk."""
+        self._remember(key, copy.deepcopy(result))
+        if self.directory is not None:
+            self._save(key, result)
+            self._evict_disk()
+
+    def invalidate(self, key=None):
+        """Removes one entry, or all entries if 'key' is None, from memory and disk."""
+        keys = list(self._memory) if key is None else [key]
+        if key is None and self.directory is not None:
+            keys += [name[:-4] for name in os.listdir(self.directory) if name.endswith(('.npz', '.tmp'))]
+        for entry in set(keys):
+            self._memory.pop(entry, None)
+            if self.directory is None:
+                continue
+            for path in (self._path(entry), self._temporary_path(entry)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def calibrate(self, specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                  denominator_epsilon, z_lim, analytic_jacobian=False, locus_options=None, refresh=False,
+                  callback=None):
+        """
+        Returns the cached calibration result of these inputs, or runs 'KHPS2_calibration'
+        and caches it. 'refresh=True' ignores and replaces any cached entry. The optional
+        residual evaluation 'callback' is only called when the calibration is run. Inputs
+        without a reproducible cache key are calibrated without caching.
+        """
+        try:
+            key = self.key(specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                           denominator_epsilon, analytic_jacobian)
+        except TypeError:
+            key = None
+            self.misses += 1
+        if key is not None and not refresh:
+            result = self.get(key)
+            if result is not None:
+                return self._with_locus_settings(result, z_lim, locus_options)
+        result = KHPS2_calibration(specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                                   denominator_epsilon, z_lim, analytic_jacobian, locus_options, callback)
+        if key is None:
+            return result
+        if self.store_locus:
+            result.locus_surface, result.plane_stress        # Computed now, so that they are saved with the entry
+        self.put(key, result)
+        return result
+
+    @staticmethod
+    def _with_locus_settings(result, z_lim, locus_options):
+        # A cached result with other locus settings gets a fresh (lazy) locus geometry
+        locus_options = {**DEFAULT_LOCUS_OPTIONS, **(locus_options or {})}
+        if _canonical([list(result.z_lim), result.locus_options]) != _canonical([list(z_lim), locus_options]):
+            wall_time = {stage: seconds for stage, seconds in result.diagnostics['wall_time'].items()
+                         if stage not in ('locus_surface', 'plane_stress')}
+            result = KHPS2Result(result.final_G_params, result.ef_k, result.tri_k, result.invar_k,
+                                 (result.ef_r, result.total_abs_difference, result.p_calibration_error,
+                                  result.pt_calibration_error),
+                                 result.denominator_epsilon, z_lim, result.optimization_result, locus_options,
+                                 {**result.diagnostics, 'wall_time': wall_time})
+        return result
+
+    def _remember(self, key, result):
+        # Memory tier - least recently used entries are dropped first
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _save(self, key, result):
+        optimization = result.optimization_result or {}
+        arrays = {
+            'final_G_params': result.final_G_params, 'ef_k': result.ef_k, 'tri_k': result.tri_k,
+            'invar_k': result.invar_k, 'ef_r': result.ef_r, 'total_abs_difference': result.total_abs_difference,
+            'p_calibration_error': result.p_calibration_error, 'pt_calibration_error': result.pt_calibration_error,
+            'denominator_epsilon': result.denominator_epsilon, 'z_lim': np.asarray(result.z_lim, dtype=float),
+            'locus_options': json.dumps(_canonical(result.locus_options)),
+            'optimization': json.dumps({name: _canonical(optimization.get(name))
+                                        for name in ('cost', 'nfev', 'njev', 'status', 'success', 'message')}),
+            'diagnostics': json.dumps(_canonical(result.diagnostics))}
+        if self.store_locus and 'locus_surface' in result.__dict__:
+            arrays.update(ef=result.ef, tri_c=result.tri_c, tri1=result.tri1, invar1=result.invar1, ef1=result.ef1)
+        # Written through a file handle - np.savez would append '.npz' to a path, and the partial
+        # file must not look like an entry to '_evict_disk' or 'invalidate'
+        with open(self._temporary_path(key), 'wb') as file:
+            np.savez(file, **arrays)
+        os.replace(self._temporary_path(key), self._path(key))      # Atomic - readers never see partial files
+
+    def _load(self, key):
+        with np.load(self._path(key)) as stored:
+            optimization = json.loads(str(stored['optimization']))
+            result = KHPS2Result(stored['final_G_params'], stored['ef_k'], stored['tri_k'], stored['invar_k'],
+                                 (stored['ef_r'], float(stored['total_abs_difference']),
+                                  stored['p_calibration_error'], float(stored['pt_calibration_error'])),
+                                 float(stored['denominator_epsilon']), list(stored['z_lim']),
+                                 OptimizeResult(x=stored['final_G_params'], **optimization),
+                                 json.loads(str(stored['locus_options'])),
+                                 json.loads(str(stored['diagnostics'])) if 'diagnostics' in stored.files else None)
+            if 'ef' in stored.files:
+                n_tri, n_invar = np.broadcast_to(result.locus_options['grid_resolution'], 2)
+                x_tri, y_invar = np.meshgrid(np.linspace(*result.locus_options['tri_range'], n_tri),
+                                             np.linspace(*result.locus_options['invar_range'], n_invar))
+                result.locus_surface = (x_tri, y_invar, stored['ef'], stored['tri_c'])
+                result.plane_stress = (stored['tri1'], stored['invar1'], stored['ef1'])
+        return result
+
+    def _touch(self, key):
+        # Marks the disk entry as recently used for the eviction (memory hits included)
+        if self.directory is not None and os.path.exists(self._path(key)):
+            os.utime(self._path(key))
+
+    def _evict_disk(self):
+        # Disk tier - least recently used files are removed until the size limit is met
+        entries = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith('.npz')]
+        entries = sorted((os.stat(path).st_mtime, os.stat(path).st_size, path) for path in entries)
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
@@ -1,14 +1,17 @@
     # Standard library import
+import time
 import numpy as np
 from scipy.optimize import least_squares
 
     # Custom package import
-from .KHPS2_function import KHPS2_function
+from .KHPS2_residual import KHPS2Residual
+from .KHPS2_result import KHPS2Result
 from .Locus_calculation import locus_calculation
 
     # KHPS2 calculation function
 def KHPS2_calculation(specimen_data, initial_G, lower_bounds, upper_bounds,
-                      optimization_options, denominator_epsilon, z_lim):
+                      optimization_options, denominator_epsilon, z_lim, analytic_jacobian=False,
+                      locus_options=None, callback=None, return_diagnostics=False):
     """
     Performs the full KHPS2 fracture criterion calculation and optimization pipeline.
 
@@ -18,7 +21,8 @@ def KHPS2_calculation(specimen_data, initial_G, lower_bounds, upper_bounds,
 
     Function execution:
         KHPS2_calculation(specimen_data, initial_G, lower_bounds, upper_bounds,
-                        optimization_options, denominator_epsilon, z_lim):
+                        optimization_options, denominator_epsilon, z_lim, analytic_jacobian=False,
+                        locus_options=None, callback=None, return_diagnostics=False):
 
     Function's input args:
         specimen_data: A dictionary containing experimental specimen data.
@@ -37,6 +41,20 @@ def KHPS2_calculation(specimen_data, initial_G, lower_bounds, upper_bounds,
         z_lim: A list [min_z, max_z] defining the lower and upper limits
             for the Z-axis (Fracture strain) in figures. The 'max_z' value is
             also used to clip calculated fracture strain values.
+        analytic_jacobian: If True, the closed-form Jacobian of the residuals (see 'KHPS2_jacobian')
+            is passed to 'scipy.optimize.least_squares' instead of the default finite
+            difference approximation. Any 'jac' entry in 'optimization_options' takes precedence.
+            Default is False.
+        locus_options: Optional dictionary with the 'grid_resolution', 'tri_range', 'invar_range'
+            and 'plane_stress_resolution' of the locus surface and plane stress curve.
+            Defaults (999 x 999 grid over [-3, 3] x [-1, 1]) are in 'DEFAULT_LOCUS_OPTIONS'.
+            A 'dtype' entry ('float32' or 'float64') selects the memory-lean surface evaluation
+            (see 'locus_surface_grid').
+        callback: Optional function callback(G, cost, elapsed) called after every residual
+            evaluation of the optimizer (finite difference steps included) with the evaluated
+            parameters, the cost 0.5 * sum(residuals**2) and the seconds since the optimizer start.
+        return_diagnostics: If True, the diagnostics dictionary (see 'KHPS2_diagnostics') is
+            appended as a 16th value to the returned tuple. Default is False.
 
     Function's return args:
         A tuple containing the following results:
@@ -74,38 +92,158 @@ def KHPS2_calculation(specimen_data, initial_G, lower_bounds, upper_bounds,
               for the main locus surface, used for plotting the cut-off plane.
     """
 
-    # The least squares optimization method run function - Minimizes residuals and returns material parameters G1,... G6
-    result = least_squares(lambda G_params: KHPS2_function(G_params, specimen_data, denominator_epsilon),
-                           initial_G, bounds=(lower_bounds, upper_bounds), **optimization_options)
-    
+    # Calibration (optimization and error evaluation) - the locus geometry is computed lazily by the result object
+    result = KHPS2_calibration(specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                               denominator_epsilon, z_lim, analytic_jacobian, locus_options, callback)
+
+    # Returned calculated values of Stress triaxiality, Normalized third invariant, Fracture strain of the main surface,
+    # cut-off plane, plane stress curve, etc..., also returns material parameters G1,... G6 and calibration errors
+    if return_diagnostics:
+        return result.as_tuple() + (result.diagnostics,)
+    return result.as_tuple()
+
+
+    # KHPS2 calibration function (without eager locus calculation)
+def KHPS2_calibration(specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                      denominator_epsilon, z_lim, analytic_jacobian=False, locus_options=None, callback=None):
+    """
+    Calibrates the KHPS2 material parameters and returns a lightweight 'KHPS2Result'.
+
+    Same inputs as 'KHPS2_calculation'. Only the optimization and the calibration error
+    evaluation are run here. The locus surface, cut-off plane and plane stress curve are
+    calculated on first access of the corresponding attributes of the returned object
+    (e.g. 'result.ef' or 'result.tri1'), using the resolution and ranges of 'locus_options'.
+    The optimizer statistics and stage wall times are stored in 'result.diagnostics'.
+
+    Function execution:
+        result = KHPS2_calibration(specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                                   denominator_epsilon, z_lim, analytic_jacobian=False, locus_options=None,
+                                   callback=None)
+
+    Function's return args:
+        A 'KHPS2Result' object (see KHPS2_result.py).
+    """
+
+    # Optimization stage - calibrated material parameters G1,... G6
+    start = time.perf_counter()
+    optimization_result, residual = KHPS2_optimization(specimen_data, initial_G, lower_bounds, upper_bounds,
+                                                       optimization_options, denominator_epsilon, analytic_jacobian,
+                                                       callback)
+    optimization_time = time.perf_counter() - start
+
     # Final LSM results (Material parameters - KHPS2_function's unknown values)
-    final_G_params = result.x
-
-    # Mesh matrix creation (Stress triaxiality - Normalized third invariant)
-    Y_invar = np.linspace(-1, 1, 999)                   # Normalized third invariant - y coordinate
-    X_tri = np.linspace(-3, 3, 999)                     # Stress triaxiality - x coordinate
-    x_tri, y_invar = np.meshgrid(X_tri, Y_invar)        # Grid mesh creation
-
-    # Locus cut-off plane stress triaxiality and fracture stain calculation
-    tri_c, ef = locus_calculation(final_G_params, x_tri, y_invar, denominator_epsilon)
-    ef[x_tri < tri_c] = np.nan              # Fracture strain suppression behind cut-off plane
-    ef[ef < 0] = np.nan                     # Fracture strain suppression below 0 Z-coordinate
-    ef[ef > z_lim[1]] = np.nan              # Fracture strain suppression above Z axis limit (using z_lim[1] for consistency)
-
-    # Calculation of the plane stress curve
-    tri1 = np.linspace(-2/3, 2/3, 999)              # Plane stress state - triaxiality
-    invar1 = -27/2. * tri1 * (tri1**2 - 1/3)        # Plane stress state - normalized third invariant
-
-    # Plane stress cut-off plane stress triaxiality and fracture stain calculation
-    tri_c1, ef1 = locus_calculation(final_G_params, tri1, invar1, denominator_epsilon)
-    ef1[ef1 < 0] = np.nan                     # Fracture strain suppression below 0 Z-coordinate
-    ef1[ef1 > z_lim[1]] = np.nan              # Fracture strain suppression above Z axis limit
-
-    # Measured specimens value assignment for marker plotting
-    specimens_np_array = np.array(list(specimen_data.values()))      # Numpy array extraction
-    ef_k = specimens_np_array[:, 0]       # Fracture strain of the measured specimens
-    tri_k = specimens_np_array[:, 1]      # Stress triaxiality of the measured specimens
-    invar_k = specimens_np_array[:, 2]    # Normalized third invariant of the measured specimens
+    final_G_params = optimization_result.x
+
+    # Calibration error evaluation at the measured specimens
+    start = time.perf_counter()
+    calibration_error = KHPS2_calibration_error(final_G_params, residual.ef_k, residual.tri_k,
+                                                residual.invar_k, denominator_epsilon)
+    diagnostics = KHPS2_diagnostics(optimization_result, residual, optimization_time, time.perf_counter() - start)
+    return KHPS2Result(final_G_params, residual.ef_k, residual.tri_k, residual.invar_k, calibration_error,
+                       denominator_epsilon, z_lim, optimization_result, locus_options, diagnostics)
+
+
+    # KHPS2 optimization stage function
+def KHPS2_optimization(specimen_data, initial_G, lower_bounds, upper_bounds,
+                       optimization_options, denominator_epsilon, analytic_jacobian=False, callback=None):
+    """
+    Runs only the least squares calibration of the KHPS2 material parameters.
+
+    Function execution:
+        result, residual = KHPS2_optimization(specimen_data, initial_G, lower_bounds, upper_bounds,
+                                              optimization_options, denominator_epsilon, analytic_jacobian=False,
+                                              callback=None)
+
+    Function's input args:
+        Same meaning as in 'KHPS2_calculation'. 'specimen_data' may also be an already
+        packed 'KHPS2Residual' object, which is then used as is.
+
+    Function's return args:
+        - result: The 'scipy.optimize.OptimizeResult' returned by 'least_squares'
+          (calibrated parameters in 'result.x', plus 'cost', 'nfev', 'njev', 'status', ...).
+        - residual: The 'KHPS2Residual' evaluator holding the packed specimen arrays.
+    """
+
+    # Packed residual evaluator - same residuals as KHPS2_function without rebuilding the specimen arrays
+    if isinstance(specimen_data, KHPS2Residual):
+        residual = specimen_data
+    else:
+        residual = KHPS2Residual(specimen_data, denominator_epsilon)
+    if analytic_jacobian and 'jac' not in optimization_options:
+        optimization_options = dict(optimization_options, jac=residual.jac)
+
+    # Residual evaluation hook - reports every evaluation to the callback
+    if callback is None:
+        fun = residual
+    else:
+        start = time.perf_counter()
+
+        def fun(G):
+            residuals = residual(G)
+            callback(np.array(G), 0.5 * np.dot(residuals, residuals), time.perf_counter() - start)
+            return residuals
+
+    # The least squares optimization method run function - Minimizes residuals and returns material parameters G1,... G6
+    result = least_squares(fun, initial_G, bounds=(lower_bounds, upper_bounds), **optimization_options)
+    return result, residual
+
+
+    # KHPS2 diagnostics record function
+def KHPS2_diagnostics(optimization_result, residual, optimization_time, calibration_error_time):
+    """
+    Collects the optimizer statistics and stage wall times of one calibration.
+
+    Function execution:
+        diagnostics = KHPS2_diagnostics(optimization_result, residual, optimization_time, calibration_error_time)
+
+    Function's input args:
+        optimization_result, residual: The values returned by 'KHPS2_optimization'.
+        optimization_time, calibration_error_time: Wall times [s] of the two stages.
+
+    Function's return args:
+        A dictionary of plain Python values (JSON-serializable):
+            - 'nfev', 'njev': Function / Jacobian evaluations counted by 'least_squares'
+              ('njev' is None for method 'lm').
+            - 'n_residual_evaluations', 'n_jacobian_evaluations': Evaluations of the residual
+              evaluator, finite difference steps included.
+            - 'cost', 'optimality', 'status', 'success', 'message': Termination state of 'least_squares'.
+            - 'n_specimens': Number of calibration points.
+            - 'wall_time': Dictionary of stage wall times [s] - 'optimization', 'calibration_error',
+              and 'locus_surface', 'plane_stress' once the lazy locus geometry is calculated.
+    """
+    return {
+        'nfev': int(optimization_result.nfev),                                  # least_squares function evaluations
+        'njev': None if optimization_result.njev is None else int(optimization_result.njev),
+        'n_residual_evaluations': residual.n_residual_evaluations,              # Including finite difference steps
+        'n_jacobian_evaluations': residual.n_jacobian_evaluations,              # Analytic Jacobian evaluations
+        'cost': float(optimization_result.cost),                                # Final cost
+        'optimality': float(optimization_result.optimality),                    # First order optimality measure
+        'status': int(optimization_result.status),                              # Termination status
+        'success': bool(optimization_result.success),                           # Convergence flag
+        'message': str(optimization_result.message),                            # Termination message
+        'n_specimens': int(residual.size),                                      # Number of calibration points
+        'wall_time': {'optimization': optimization_time,                        # Stage wall times [s]
+                      'calibration_error': calibration_error_time}}
+
+
+    # KHPS2 calibration error function
+def KHPS2_calibration_error(final_G_params, ef_k, tri_k, invar_k, denominator_epsilon):
+    """
+    Assesses the calibration error of the KHPS2 locus against the measured specimens.
+
+    Function execution:
+        KHPS2_calibration_error(final_G_params, ef_k, tri_k, invar_k, denominator_epsilon):
+
+    Function's input args:
+        final_G_params: A 1D NumPy array of calibrated material parameters [G1, G2, G3, G4, G5, G6].
+        ef_k, tri_k, invar_k: 1D NumPy arrays of measured fracture strains, stress triaxialities
+            and normalized third invariants of the calibration points.
+        denominator_epsilon: Numerical stability constant of 'locus_calculation'.
+
+    Function's return args:
+        A tuple (ef_r, total_abs_difference, p_calibration_error, pt_calibration_error)
+        with the same meaning as in 'KHPS2_calculation'.
+    """
 
     # Cut-off plane stress triaxiality and fracture stain of the locus for the same stress state as the calibration points
     tri_c_kal, ef_kal = locus_calculation(final_G_params, tri_k, invar_k, denominator_epsilon)
@@ -126,8 +264,4 @@ def KHPS2_calculation(specimen_data, initial_G, lower_bounds, upper_bounds,
 
     # Total calibration error in percentages
     pt_calibration_error = np.sum(p_calibration_error)
-
-    # Returned calculated values of Stress triaxiality, Normalized third invariant, Fracture strain of the main surface,
-    # cut-off plane, plane stress curve, etc..., also returns material parameters G1,... G6 and calibration errors
-    return (final_G_params, x_tri, y_invar, ef, tri1, invar1, ef1,
-                tri_k, invar_k, ef_k, ef_r, total_abs_difference, p_calibration_error, pt_calibration_error, tri_c)
\ No newline at end of file
+    return ef_r, total_abs_difference, p_calibration_error, pt_calibration_error
\ No newline at end of file
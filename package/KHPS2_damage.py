@@ -0,0 +1,151 @@
+    # Library import
+import numpy as np
+
+    # Custom package import
+from .KHPS2_locus import KHPS2Locus
+
+
+    # Streaming KHPS2 damage accumulation along element load paths
+class KHPS2DamageAccumulator:
+    """
+    Running KHPS2 damage D = sum(d_eps / ef(tri, invar)) of many elements along their load paths.
+
+    The load paths are consumed chunk by chunk (a few increments of all elements at a time),
+    so whole histories never have to be held in memory. Each chunk is processed in blocks of
+    'block_elements' elements, which bounds the temporary memory to about
+    (increments per chunk) x (block_elements) values, also when the chunk is a lazy slice
+    of a memory-mapped file.
+
+    The fracture strain follows 'locus_calculation' (see 'KHPS2Locus'). Increments whose
+    fracture strain is not a positive finite value - behind the cut-off plane, on the
+    denominator_epsilon pole or below 0 - do not add damage.
+
+    Object creation:
+        accumulator = KHPS2DamageAccumulator(final_G_params, n_elements, denominator_epsilon=1e-6,
+                                             critical_damage=1.0, block_elements=65536, locus=None)
+
+    Input args:
+        final_G_params: Calibrated material parameters [G1, G2, G3, G4, G5, G6].
+        n_elements: Number of elements (integration points) of the load paths.
+        denominator_epsilon: Numerical stability constant of 'locus_calculation'.
+        critical_damage: Damage value of fracture onset, 1.0 by default.
+        block_elements: Number of elements processed at once.
+        locus: Optional prebuilt 'KHPS2Locus' (e.g. tabulated); created from final_G_params otherwise.
+
+    Attributes:
+        damage: 1D array of the accumulated damage of each element.
+        fracture_step: 1D integer array of the (0-based) increment at which each element
+            reached 'critical_damage', -1 for elements which did not fracture.
+        n_steps: Number of consumed increments.
+    """
+
+    def __init__(self, final_G_params, n_elements, denominator_epsilon=1e-6, critical_damage=1.0,
+                 block_elements=65536, locus=None):
+        self.locus = locus if locus is not None else KHPS2Locus(final_G_params, denominator_epsilon,
+                                                                cut_off_value=np.inf)
+        self.critical_damage = critical_damage
+        self.block_elements = block_elements
+        self.damage = np.zeros(n_elements)
+        self.fracture_step = np.full(n_elements, -1, dtype=np.int64)
+        self.n_steps = 0
+
+    @property
+    def fractured(self):
+        """Boolean array of the elements which reached the critical damage."""
+        return self.fracture_step >= 0
+
+    def update(self, d_eps, tri, invar):
+        """
+        Consumes the next increments of all elements.
+
+        Input args:
+            d_eps, tri, invar: Arrays of shape (increments, n_elements) - or (n_elements,) for a
+                single increment - of equivalent plastic strain increments, stress triaxiality
+                and normalized third invariant. Memory-mapped arrays are read block by block.
+
+        Returns the object itself.
+        """
+        if np.ndim(d_eps) == 1:
+            d_eps, tri, invar = d_eps[None, :], tri[None, :], invar[None, :]
+        n_increments, n_elements = np.shape(d_eps)
+        if n_elements != self.damage.size:
+            raise ValueError(f"Expected {self.damage.size} elements, got {n_elements}.")
+
+        for start in range(0, n_elements, self.block_elements):
+            block = slice(start, min(start + self.block_elements, n_elements))
+            strain_increment = np.asarray(d_eps[:, block], dtype=float)
+
+            # Damage increments d_eps / ef (0 where the fracture strain is not positive and finite)
+            ef = self.locus(np.asarray(tri[:, block], dtype=float), np.asarray(invar[:, block], dtype=float))
+            damage_increment = np.zeros_like(ef)
+            np.divide(strain_increment, ef, out=damage_increment, where=ef > 0)
+
+            # Running damage after every increment of the chunk
+            np.cumsum(damage_increment, axis=0, out=damage_increment)
+            damage_increment += self.damage[block]
+
+            # Fracture onset - first increment reaching the critical damage
+            fracture_step = self.fracture_step[block]
+            crossed = (fracture_step < 0) & (damage_increment[-1] >= self.critical_damage)
+            if crossed.any():
+                first = np.argmax(damage_increment[:, crossed] >= self.critical_damage, axis=0)
+                fracture_step[crossed] = self.n_steps + first
+            self.damage[block] = damage_increment[-1]
+
+        self.n_steps += n_increments
+        return self
+
+
+    # Load path chunk reader for memory-mapped .npy files
+def load_path_chunks(source, increments_per_chunk=16):
+    """
+    Yields load path chunks (d_eps, tri, invar) of 'increments_per_chunk' increments.
+
+    Function's input args:
+        source: Either the path of one .npy file of shape (n_increments, n_elements, 3) holding
+            [equivalent plastic strain increment, stress triaxiality, normalized third invariant],
+            or a tuple of three .npy paths of shape (n_increments, n_elements) each.
+            The files are memory-mapped, chunks are lazy views read on access.
+        increments_per_chunk: Number of increments per yielded chunk.
+
+    Yields:
+        Tuples (d_eps, tri, invar) of arrays of shape (increments, n_elements).
+    """
+    if isinstance(source, (tuple, list)):
+        d_eps, tri, invar = (np.load(path, mmap_mode='r') for path in source)
+    else:
+        load_path = np.load(source, mmap_mode='r')
+        d_eps, tri, invar = load_path[..., 0], load_path[..., 1], load_path[..., 2]
+    for start in range(0, d_eps.shape[0], increments_per_chunk):
+        stop = start + increments_per_chunk
+        yield d_eps[start:stop], tri[start:stop], invar[start:stop]
+
+
+    # KHPS2 damage accumulation function
+def accumulate_damage(chunks, final_G_params, n_elements=None, denominator_epsilon=1e-6, critical_damage=1.0,
+                      block_elements=65536, locus=None):
+    """
+    Integrates the KHPS2 damage over a stream of load path chunks.
+
+    Function execution:
+        accumulator = accumulate_damage(chunks, final_G_params, n_elements=None, denominator_epsilon=1e-6,
+                                        critical_damage=1.0, block_elements=65536, locus=None)
+
+    Function's input args:
+        chunks: Iterable of (d_eps, tri, invar) chunks, e.g. a generator or 'load_path_chunks'.
+        n_elements: Number of elements; taken from the first chunk if None.
+        Other args: see 'KHPS2DamageAccumulator'.
+
+    Function's return args:
+        The 'KHPS2DamageAccumulator' with the final 'damage', 'fracture_step' and 'n_steps'.
+    """
+    accumulator = None
+    for d_eps, tri, invar in chunks:
+        if accumulator is None:
+            accumulator = KHPS2DamageAccumulator(final_G_params, n_elements or np.shape(d_eps)[-1],
+                                                 denominator_epsilon, critical_damage, block_elements, locus)
+        accumulator.update(d_eps, tri, invar)
+    if accumulator is None:
+        accumulator = KHPS2DamageAccumulator(final_G_params, n_elements or 0, denominator_epsilon,
+                                             critical_damage, block_elements, locus)
+    return accumulator
@@ -59,4 +59,64 @@ def KHPS2_function(G, specimen_data, denominator_epsilon = 1e-6):
 
     # Residual calculation: difference between ideal (measured) fracture strain and calculated fracture strain value
         residuals = ef_k - ef_kal
-        return residuals
\ No newline at end of file
+        return residuals
+
+    # Analytic Jacobian of the KHPS2 residuals - derivatives of KHPS2_function with respect to G1, G2,... G6
+        # ef = (G4*a + G5*b + G6*c) / d      d = tri + G1*a + G2*c + G3*b
+        # a = (invar**2 + invar)/2   b = (invar**2 - invar)/2   c = 1 - invar**2
+def KHPS2_jacobian(G, specimen_data, denominator_epsilon = 1e-6):
+        """
+        Calculates the analytic Jacobian of the KHPS2 residuals with respect to G1,... G6.
+
+        The KHPS2 formula from Locus_calculation.py can be rewritten as a ratio of two
+        functions that are both linear in the material parameters:
+            ef = (G4*a + G5*b + G6*c) / d,    d = tri - tri_c = tri + G1*a + G2*c + G3*b
+        where a = (invar**2 + invar)/2, b = (invar**2 - invar)/2 and c = 1 - invar**2.
+        The derivatives of the residuals (ef_k - ef) are therefore available in closed form
+        and can be passed to 'scipy.optimize.least_squares' through its 'jac' argument,
+        which replaces the finite difference approximation and its additional evaluations.
+
+        Input parameters:          KHPS2_jacobian(G, specimen_data, denominator_epsilon)
+            G:
+                A 1D array of 6 material parameters (unknown constants) for the KHPS2 model.
+            specimen_data:
+                A dictionary in the same format as for KHPS2_function:
+                    {specimen_name: [Fracture strain, Stress triaxiality, Normalized third invariant]}
+            denominator_epsilon:
+                A small value to prevent division by zero, ensuring numerical stability.
+                float with default value of 1e-6
+
+        The function returns a 2D array of shape (number of specimens, 6). Row i contains the
+        derivatives of the i-th residual with respect to G1,... G6. Rows of specimens lying
+        within 'denominator_epsilon' of the cut-off plane are NaN, consistently with the
+        residuals returned by KHPS2_function.
+        """
+    # Initial material parameter inputs unpacking
+        G1, G2, G3, G4, G5, G6 = G
+
+    # Extraction of the measured stress triaxialities and normalized third invariants
+        specimens_np_array = np.array(list(specimen_data.values()), dtype=float)
+        tri_k = specimens_np_array[:, 1]
+        invar_k = specimens_np_array[:, 2]
+
+    # Invariant basis functions shared by the numerator and the denominator
+        a = (invar_k**2 + invar_k) / 2
+        b = (invar_k**2 - invar_k) / 2
+        c = 1 - invar_k**2
+
+    # Denominator filtering for numerical stability (same cut-off rule as in locus_calculation)
+        denominator_raw = tri_k + G1 * a + G2 * c + G3 * b
+        denominator_filtered = np.where(np.abs(denominator_raw) < denominator_epsilon, np.nan, denominator_raw)
+        numerator = G4 * a + G5 * b + G6 * c
+
+    # Residual derivatives:  d(ef_k - ef)/dG = -d(ef)/dG
+        inverse_denominator = 1 / denominator_filtered
+        strain_factor = numerator * inverse_denominator**2      # Derivative factor of the cut-off parameters G1, G2, G3
+        jacobian = np.empty((tri_k.size, 6))
+        jacobian[:, 0] = a * strain_factor
+        jacobian[:, 1] = c * strain_factor
+        jacobian[:, 2] = b * strain_factor
+        jacobian[:, 3] = -a * inverse_denominator
+        jacobian[:, 4] = -b * inverse_denominator
+        jacobian[:, 5] = -c * inverse_denominator
+        return jacobian
@@ -0,0 +1,194 @@
+    # Library import
+import numpy as np
+
+    # Custom package import
+from .Locus_calculation import locus_calculation, cut_off_triaxiality
+from .KHPS2_result import DEFAULT_LOCUS_OPTIONS
+
+
+    # Calibrated KHPS2 fracture locus evaluator for large batches of stress states
+class KHPS2Locus:
+    """
+    Fast evaluator of a calibrated KHPS2 fracture locus for post-processing of FE results.
+
+    The locus is evaluated in chunks of 'chunk_size' stress states using preallocated
+    scratch buffers, so the working memory does not grow with the batch size
+    ('memory_budget' bytes of scratch). Each chunk is evaluated by the memory-lean mode of
+    'locus_calculation' (Horner form, written into the result in place): NaN is returned
+    where |tri - tri_c| < denominator_epsilon. Stress states behind the cut-off plane
+    (tri < tri_c) keep the value of the formula by default, or are set to 'cut_off_value'
+    (e.g. np.nan like the plotted locus, or np.inf for "no fracture").
+
+    Optionally, 'tabulate' precomputes the locus on a regular (triaxiality, invariant) table
+    whose bilinear interpolation error is below a tolerance. Table cells which do not meet
+    the tolerance, straddle the cut-off pole or contain suppressed values are flagged and
+    evaluated exactly, as are stress states outside the table ranges. The KHPS2 formula only
+    costs a few multiply-adds, so the exact chunked evaluation is usually faster than the
+    table lookup (see benchmarks/locus_benchmark.py). The table is mainly a tabulated
+    surface with a known error bound, e.g. for export to FE codes.
+
+    Object creation:
+        locus = KHPS2Locus(final_G_params, denominator_epsilon=1e-6, cut_off_value=None, memory_budget=8 * 2**20)
+
+    Usage:
+        ef = locus(tri, invar)                      # Table interpolation if tabulated, exact otherwise
+        ef = locus.evaluate(tri, invar, out=ef)     # Always exact
+        locus.tabulate(tolerance=1e-4, max_table_bytes=64 * 2**20)
+    """
+
+    # Number of float64 scratch arrays of one chunk (tri_c, and the table coordinates and weights),
+    # plus the two tile temporaries of the memory-lean 'locus_calculation'
+    _SCRATCH_ARRAYS = 7
+
+    def __init__(self, G_params, denominator_epsilon=1e-6, cut_off_value=None, memory_budget=8 * 2**20):
+        G1, G2, G3, G4, G5, G6 = np.asarray(G_params, dtype=float)
+        self.G_params = np.array([G1, G2, G3, G4, G5, G6])
+        self.denominator_epsilon = denominator_epsilon
+        self.cut_off_value = cut_off_value
+
+        # Chunk size fitting the scratch buffers into the memory budget
+        self.chunk_size = max(1024, int(memory_budget) // (8 * self._SCRATCH_ARRAYS))
+        self._scratch = np.empty((self._SCRATCH_ARRAYS - 2, self.chunk_size))
+        self._mask = np.empty(self.chunk_size, dtype=bool)
+
+        # Tabulated surface (see 'tabulate')
+        self.table = None
+
+    def cut_off(self, invar_values):
+        """Returns the cut-off stress triaxiality tri_c for the given normalized third invariants."""
+        return cut_off_triaxiality(self.G_params, invar_values)
+
+    def _evaluate_chunk(self, tri, invar, out):
+        # Exact evaluation of one chunk into 'out' - memory-lean locus_calculation with a scratch buffer for tri_c
+        tri_c = self._scratch[0, :tri.size]
+        locus_calculation(self.G_params, tri, invar, self.denominator_epsilon, out=(tri_c, out))
+        if self.cut_off_value is not None:
+            mask = self._mask[:tri.size]
+            np.subtract(tri, tri_c, out=tri_c)
+            np.less_equal(tri_c, -self.denominator_epsilon, out=mask)
+            np.copyto(out, self.cut_off_value, where=mask)  # Stress states behind the cut-off plane
+
+    def _chunked(self, chunk_function, tri_values, invar_values, out):
+        # Broadcast inputs, iterate over flat chunks and write into 'out'
+        tri_values, invar_values = np.broadcast_arrays(np.asarray(tri_values, dtype=float),
+                                                       np.asarray(invar_values, dtype=float))
+        if out is None:
+            out = np.empty(tri_values.shape)
+        elif out.shape != tri_values.shape or out.dtype != np.float64 or not out.flags.c_contiguous:
+            raise ValueError(f"'out' has to be a C-contiguous float64 array of shape {tri_values.shape}, "
+                             f"got {out.dtype} array of shape {out.shape}.")
+        tri_flat, invar_flat = tri_values.ravel(), invar_values.ravel()
+        out_flat = out.reshape(-1)                          # View of the contiguous 'out'
+        for start in range(0, tri_flat.size, self.chunk_size):
+            stop = min(start + self.chunk_size, tri_flat.size)
+            chunk_function(tri_flat[start:stop], invar_flat[start:stop], out_flat[start:stop])
+        return out
+
+    def evaluate(self, tri_values, invar_values, out=None):
+        """
+        Exact fracture strain for arrays of stress triaxiality and normalized third invariant,
+        written into 'out' (allocated if None, else a C-contiguous float64 array of the
+        broadcast input shape) and returned.
+        """
+        return self._chunked(self._evaluate_chunk, tri_values, invar_values, out)
+
+    def tabulate(self, tolerance=1e-4, locus_options=None, initial_resolution=65, max_table_bytes=64 * 2**20):
+        """
+        Precomputes the locus on a regular table with a bilinear interpolation error below 'tolerance'.
+
+        The resolution starts at 'initial_resolution' points per axis and is doubled while
+        more than 1 % of the table cells exceed 'tolerance' and the table fits into
+        'max_table_bytes'. The cells which still exceed the tolerance (checked at their center
+        and edge midpoints) are flagged for exact evaluation. The check points are evaluated
+        in tiles of about 'chunk_size' values, so the validation adds no full-size arrays to
+        the table memory.
+
+        Input args:
+            tolerance: Maximum accepted absolute interpolation error of the fracture strain.
+            locus_options: Dictionary with the 'tri_range' and 'invar_range' of the table
+                (defaults in 'DEFAULT_LOCUS_OPTIONS').
+            initial_resolution: Initial number of table points per axis.
+            max_table_bytes: Memory budget of the table and its cell flags (validation included).
+
+        Returns the object itself, with the 'table' dictionary set:
+            'tri_range', 'invar_range', 'ef' (2D table), 'exact_cells' (2D boolean cell flags),
+            'resolution', 'exact_fraction' (share of flagged cells).
+        """
+        locus_options = {**DEFAULT_LOCUS_OPTIONS, **(locus_options or {})}
+        tri_range, invar_range = locus_options['tri_range'], locus_options['invar_range']
+        resolution = initial_resolution
+        while True:
+            table = self._build_table(tri_range, invar_range, resolution, tolerance)
+            next_resolution = 2 * resolution - 1
+            next_bytes = next_resolution**2 * 8 + (next_resolution - 1)**2
+            if table['exact_fraction'] <= 0.01 or next_bytes > max_table_bytes:
+                break
+            resolution = next_resolution
+        self.table = table
+        return self
+
+    def _build_table(self, tri_range, invar_range, resolution, tolerance):
+        # Table nodes, cell centers and edge midpoints on a grid of half the node spacing
+        tri = np.linspace(*tri_range, 2 * resolution - 1)
+        invar = np.linspace(*invar_range, 2 * resolution - 1)
+        ef = np.empty((resolution, resolution))
+        exact_cells = np.empty((resolution - 1, resolution - 1), dtype=bool)
+        rows = max(1, self.chunk_size // (2 * invar.size))     # Cell rows per tile
+        for start in range(0, resolution - 1, rows):
+            stop = min(start + rows, resolution - 1)
+            fine = self.evaluate(tri[2 * start:2 * stop + 1, None], invar[None, :])
+            nodes = fine[::2, ::2]
+            ef[start:stop + 1] = nodes
+            c00, c10, c01, c11 = nodes[:-1, :-1], nodes[1:, :-1], nodes[:-1, 1:], nodes[1:, 1:]
+            with np.errstate(invalid='ignore'):
+                error = np.maximum.reduce([np.abs(fine[1::2, 1::2] - (c00 + c10 + c01 + c11) / 4),
+                                           np.abs(fine[1::2, :-1:2] - (c00 + c10) / 2),
+                                           np.abs(fine[1::2, 2::2] - (c01 + c11) / 2),
+                                           np.abs(fine[:-1:2, 1::2] - (c00 + c01) / 2),
+                                           np.abs(fine[2::2, 1::2] - (c10 + c11) / 2)])
+            # Cells straddling the cut-off pole (sign change of tri - tri_c between the corners)
+            sign = np.sign(tri[2 * start:2 * stop + 1:2, None] - self.cut_off(invar[None, ::2]))
+            pole = (sign[:-1, :-1] != sign[1:, :-1]) | (sign[:-1, :-1] != sign[:-1, 1:]) | \
+                (sign[:-1, :-1] != sign[1:, 1:])
+            exact_cells[start:stop] = ~(error <= tolerance) | pole     # NaN errors (suppressed values) are flagged as well
+        return {'tri_range': tuple(tri_range), 'invar_range': tuple(invar_range),
+                'ef': ef, 'exact_cells': exact_cells,
+                'resolution': resolution, 'exact_fraction': float(np.mean(exact_cells))}
+
+    def _interpolate_chunk(self, tri, invar, out):
+        # Bilinear table interpolation of one chunk, exact evaluation of flagged cells and outside points
+        table = self.table
+        n = table['resolution']
+        x, y, u, v = self._scratch[1:5, :tri.size]
+        mask = self._mask[:tri.size]
+        np.subtract(tri, table['tri_range'][0], out=x)
+        x *= (n - 1) / (table['tri_range'][1] - table['tri_range'][0])
+        np.subtract(invar, table['invar_range'][0], out=y)
+        y *= (n - 1) / (table['invar_range'][1] - table['invar_range'][0])
+        outside = ~((x >= 0) & (x <= n - 1) & (y >= 0) & (y <= n - 1))     # Non-finite inputs are outside as well
+        np.copyto(x, 0, where=outside)
+        np.copyto(y, 0, where=outside)
+        i = np.clip(x, 0, n - 2).astype(np.intp)
+        j = np.clip(y, 0, n - 2).astype(np.intp)
+        np.subtract(x, i, out=u)
+        np.subtract(y, j, out=v)
+        ef = table['ef']
+        np.multiply(ef[i, j], (1 - u) * (1 - v), out=out)
+        out += ef[i + 1, j] * (u * (1 - v))
+        out += ef[i, j + 1] * ((1 - u) * v)
+        out += ef[i + 1, j + 1] * (u * v)
+        np.logical_or(table['exact_cells'][i, j], outside, out=mask)
+        if mask.any():
+            flagged = np.flatnonzero(mask)
+            exact = np.empty(flagged.size)
+            self._evaluate_chunk(tri[flagged], invar[flagged], exact)
+            out[flagged] = exact
+
+    def __call__(self, tri_values, invar_values, out=None):
+        """
+        Fracture strain for arrays of stress triaxiality and normalized third invariant.
+        Uses the table (if 'tabulate' was called) and exact evaluation otherwise.
+        """
+        if self.table is None:
+            return self.evaluate(tri_values, invar_values, out)
+        return self._chunked(self._interpolate_chunk, tri_values, invar_values, out)
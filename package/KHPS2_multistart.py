@@ -0,0 +1,275 @@
+    # Standard library import
+import math
+import multiprocessing
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+from scipy.stats import qmc
+
+    # Custom package import
+from .KHPS2_calculation import KHPS2_optimization
+from .KHPS2_residual import KHPS2Residual
+
+    # Error messages of the starts interrupted by the time budget and by the early stop
+_BUDGET_MESSAGE = 'time budget exceeded'
+_CANCELLED_MESSAGE = 'cancelled by the early stop'
+
+    # Early stop event of a worker process (set by '_init_worker', None in the calling process)
+_STOP_EVENT = None
+
+
+def _init_worker(stop_event):
+    global _STOP_EVENT
+    _STOP_EVENT = stop_event
+
+
+    # Exception raised inside a residual evaluation once the wall-clock budget is used up or the search stopped
+class _BudgetExceeded(Exception):
+    pass
+
+
+    # Residual evaluator that stops the optimizer at an absolute deadline (time.time() based, shared by all processes)
+    # or as soon as the early stop event is set
+class _DeadlineResidual(KHPS2Residual):
+    deadline = None
+
+    def __call__(self, G):
+        if self.deadline is not None and time.time() > self.deadline:
+            raise _BudgetExceeded(_BUDGET_MESSAGE)
+        if _STOP_EVENT is not None and _STOP_EVENT.is_set():
+            raise _BudgetExceeded(_CANCELLED_MESSAGE)
+        return super().__call__(G)
+
+
+    # Single start solve (module level, so it can be sent to worker processes)
+def _solve_start(task):
+    index, specimen_data, initial_G, lower_bounds, upper_bounds, \
+        optimization_options, denominator_epsilon, analytic_jacobian, deadline = task
+    residual = _DeadlineResidual(specimen_data, denominator_epsilon)
+    residual.deadline = deadline
+    try:
+        result, _ = KHPS2_optimization(residual, initial_G, lower_bounds, upper_bounds,
+                                       optimization_options, denominator_epsilon, analytic_jacobian)
+    except _BudgetExceeded as exc:
+        return {'index': index, 'x': None, 'cost': np.nan, 'nfev': 0, 'success': False, 'error': str(exc)}
+    except Exception as exc:        # e.g. non-finite residuals at a start lying on the cut-off pole
+        return {'index': index, 'x': None, 'cost': np.nan, 'nfev': 0, 'success': False,
+                'error': f"{type(exc).__name__}: {exc}"}
+    return {'index': index, 'x': result.x, 'cost': result.cost, 'nfev': result.nfev,
+            'success': result.success, 'error': ''}
+
+
+    # Starting point generation inside the parameter bounds
+def KHPS2_starting_points(n_starts, lower_bounds, upper_bounds, sampling='lhs', seed=None):
+    """
+    Draws 'n_starts' starting points of G1,... G6 inside [lower_bounds, upper_bounds].
+
+    Function's input args:
+        n_starts: Number of starting points.
+        lower_bounds, upper_bounds: 1D NumPy arrays of the 6 parameter bounds.
+        sampling: 'lhs' (Latin hypercube), 'sobol' (scrambled Sobol sequence) or 'random'.
+        seed: Seed of the sampler for reproducible starting points.
+
+    Function's return args:
+        A 2D NumPy array of shape (n_starts, 6).
+    """
+    lower_bounds = np.asarray(lower_bounds, dtype=float)
+    upper_bounds = np.asarray(upper_bounds, dtype=float)
+    if sampling == 'lhs':
+        sample = qmc.LatinHypercube(d=lower_bounds.size, seed=seed).random(n_starts)
+    elif sampling == 'sobol':
+        with warnings.catch_warnings():         # Balance warning for sample sizes which are not a power of 2
+            warnings.simplefilter('ignore', UserWarning)
+            sample = qmc.Sobol(d=lower_bounds.size, scramble=True, seed=seed).random(n_starts)
+    elif sampling == 'random':
+        sample = np.random.default_rng(seed).random((n_starts, lower_bounds.size))
+    else:
+        raise ValueError(f"Unknown sampling '{sampling}', expected 'lhs', 'sobol' or 'random'.")
+    return lower_bounds + sample * (upper_bounds - lower_bounds)
+
+
+    # KHPS2 multi-start calibration function
+def KHPS2_multistart(specimen_data, lower_bounds, upper_bounds, optimization_options,
+                     denominator_epsilon=1e-6, n_starts=16, sampling='lhs', initial_G=None,
+                     agreement_tol=1e-3, min_agreeing=3, min_completed_fraction=0.5, time_budget=None,
+                     workers=None, analytic_jacobian=False, seed=None):
+    """
+    Global (multi-start) calibration of the KHPS2 material parameters.
+
+    The rational form of the KHPS2 locus often leads a single least squares run into a
+    local minimum or onto the cut-off pole (tri_values - tri_c -> 0). This function runs
+    'n_starts' independent least squares solves from starting points spread over the
+    parameter bounds, concurrently in worker processes, and keeps the best solution.
+
+    Early stop: the rule is checked on the completed starts taken in start order (the first
+    k starts, once all of them have finished), so for a fixed seed the result does not depend
+    on the number of workers or on the finishing order. The search stops when at least
+    'min_completed_fraction' of the starts are in that prefix and 'min_agreeing' of its solutions
+    agree with its lowest cost solution (parameter distance, normalized by the bounds width,
+    below 'agreement_tol'). Starts after the prefix are cancelled: running solves are
+    interrupted at their next residual evaluation and their results are discarded.
+    Time budget: no new solve is started after 'time_budget' seconds, and running solves
+    are interrupted at their next residual evaluation. Interrupted starts are counted
+    as failed. A search cut by the time budget depends on the timing of the solves.
+
+    Function execution:
+        results = KHPS2_multistart(specimen_data, lower_bounds, upper_bounds, optimization_options,
+                                   denominator_epsilon=1e-6, n_starts=16, sampling='lhs', initial_G=None,
+                                   agreement_tol=1e-3, min_agreeing=3, min_completed_fraction=0.5,
+                                   time_budget=None, workers=None, analytic_jacobian=False, seed=None)
+
+    Function's input args:
+        specimen_data, lower_bounds, upper_bounds, optimization_options, denominator_epsilon,
+        analytic_jacobian: Same meaning as in 'KHPS2_calculation'.
+        n_starts: Number of starting points drawn inside the bounds.
+        sampling: Starting point design - 'lhs', 'sobol' or 'random' (see 'KHPS2_starting_points').
+        initial_G: Optional user estimate of G1,... G6, used as an additional first start.
+        agreement_tol: Normalized parameter distance under which two solutions are considered equal.
+        min_agreeing: Number of agreeing solutions (including the best one) needed for an early stop.
+            None disables the early stop.
+        min_completed_fraction: Fraction of all starts which has to be completed before an early stop.
+        time_budget: Wall-clock budget in seconds, None for no limit.
+        workers: Number of worker processes. Default (None) uses all CPU cores,
+            1 runs the starts sequentially in the calling process.
+        seed: Seed of the starting point sampler.
+
+    Function's returned value:
+        A dictionary containing:
+            - 'final_G_params': Best calibrated material parameters [G1, G2, G3, G4, G5, G6].
+            - 'cost': Least squares cost of the best solution.
+            - 'starting_points': 2D NumPy array of all starting points (n_starts, 6).
+            - 'solutions': 2D NumPy array of the finished solutions, sorted by cost.
+            - 'costs': 1D NumPy array of the costs of 'solutions'.
+            - 'agreeing': Boolean 1D NumPy array marking solutions agreeing with the best one.
+            - 'parameter_spread': Standard deviation of G1,... G6 over all finished solutions.
+            - 'parameter_range': 2D NumPy array [min, max] of G1,... G6 over all finished solutions.
+            - 'n_completed', 'n_failed', 'n_cancelled': Number of finished, failed and cancelled
+              (not run, or discarded by the early stop) starts.
+            - 'nfev': Total number of residual evaluations of all finished starts.
+            - 'stopped_early': True if the agreement criterion stopped the search.
+            - 'budget_exhausted': True if the time budget stopped the search.
+            - 'errors': List of the error messages of the failed starts.
+            - 'wall_time': Elapsed wall time in seconds.
+    """
+
+    start_time = time.time()
+    deadline = None if time_budget is None else start_time + time_budget
+    lower_bounds = np.asarray(lower_bounds, dtype=float)
+    upper_bounds = np.asarray(upper_bounds, dtype=float)
+    bounds_width = np.where(upper_bounds > lower_bounds, upper_bounds - lower_bounds, 1.0)
+
+    # Starting points (user estimate first, if given)
+    starting_points = KHPS2_starting_points(n_starts, lower_bounds, upper_bounds, sampling, seed)
+    if initial_G is not None:
+        starting_points = np.vstack([np.clip(initial_G, lower_bounds, upper_bounds), starting_points])
+    tasks = [(i, specimen_data, G0, lower_bounds, upper_bounds, optimization_options,
+              denominator_epsilon, analytic_jacobian, deadline) for i, G0 in enumerate(starting_points)]
+
+    results = {}            # Start index: solve result
+    n_ordered = 0           # Length of the prefix of starts 0, 1, ... which have all finished
+    stopped_early = False
+    min_completed = math.ceil(min_completed_fraction * len(tasks))
+
+    # Early stop check - the prefix of finished starts is extended one start at a time, so the
+    # search stops at the same prefix whatever the finishing order
+    def enough_agreement():
+        nonlocal n_ordered
+        while n_ordered in results:
+            n_ordered += 1
+            if prefix_agrees():
+                return True
+        return False
+
+    # Agreement with the lowest cost solution of the prefix
+    def prefix_agrees():
+        if min_agreeing is None or n_ordered < max(min_completed, 1):
+            return False
+        prefix = [results[i] for i in range(n_ordered) if results[i]['x'] is not None]
+        if len(prefix) < min_agreeing:
+            return False
+        solutions = np.array([entry['x'] for entry in prefix])
+        best = solutions[np.argmin([entry['cost'] for entry in prefix])]
+        distance = np.max(np.abs(solutions - best) / bounds_width, axis=1)
+        return bool(np.count_nonzero(distance <= agreement_tol) >= min_agreeing)
+
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    workers = max(1, min(workers, len(tasks)))
+    n_submitted = 0
+    if workers == 1:
+        # Sequential execution
+        for task in tasks:
+            if (deadline is not None and time.time() > deadline) or stopped_early:
+                break
+            n_submitted += 1
+            entry = _solve_start(task)
+            results[entry['index']] = entry
+            stopped_early = enough_agreement()
+    else:
+        # Concurrent execution - at most 'workers' solves in flight, so that cancelled starts are never run
+        stop_event = multiprocessing.Event()
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(stop_event,))
+        try:
+            pending = set()
+            remaining_tasks = iter(tasks)
+            while True:
+                while len(pending) < workers and not stopped_early and \
+                        (deadline is None or time.time() < deadline):
+                    task = next(remaining_tasks, None)
+                    if task is None:
+                        break
+                    pending.add(executor.submit(_solve_start, task))
+                    n_submitted += 1
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = future.result()
+                    results[entry['index']] = entry
+                if not stopped_early and enough_agreement():
+                    stopped_early = True
+                    break
+        finally:
+            # Running solves stop at their next residual evaluation, queued ones are cancelled
+            stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # Results kept - the prefix of an early stop, else all finished starts
+    kept = [results[i] for i in range(n_ordered)] if stopped_early else \
+        [results[i] for i in sorted(results)]
+    finished = [entry for entry in kept if entry['x'] is not None]
+    errors = [entry['error'] for entry in kept if entry['x'] is None]
+
+    # Solution summary
+    finished.sort(key=lambda entry: entry['cost'])
+    solutions = np.array([entry['x'] for entry in finished]).reshape(-1, lower_bounds.size)
+    costs = np.array([entry['cost'] for entry in finished])
+    if finished:
+        best = solutions[0]
+        agreeing = np.max(np.abs(solutions - best) / bounds_width, axis=1) <= agreement_tol
+        parameter_spread = np.std(solutions, axis=0)
+        parameter_range = np.array([solutions.min(axis=0), solutions.max(axis=0)])
+    else:
+        best = np.full(lower_bounds.size, np.nan)
+        agreeing = np.zeros(0, dtype=bool)
+        parameter_spread = np.full(lower_bounds.size, np.nan)
+        parameter_range = np.full((2, lower_bounds.size), np.nan)
+
+    return {
+        'final_G_params': best,                                     # Best calibrated material parameters
+        'cost': costs[0] if finished else np.nan,                   # Least squares cost of the best solution
+        'starting_points': starting_points,                         # All drawn starting points
+        'solutions': solutions,                                     # Finished solutions sorted by cost
+        'costs': costs,                                             # Costs of the finished solutions
+        'agreeing': agreeing,                                       # Solutions agreeing with the best one
+        'parameter_spread': parameter_spread,                       # Standard deviation of G1,... G6 over the solutions
+        'parameter_range': parameter_range,                         # [min, max] of G1,... G6 over the solutions
+        'n_completed': len(finished),                               # Number of finished starts
+        'n_failed': len(errors),                                    # Number of failed or interrupted starts
+        'n_cancelled': len(tasks) - len(kept),                      # Number of starts not run or discarded
+        'nfev': int(sum(entry['nfev'] for entry in finished)),      # Total number of residual evaluations
+        'stopped_early': stopped_early,                             # Search stopped by the agreement criterion
+        'budget_exhausted': not stopped_early and (len(tasks) > n_submitted or _BUDGET_MESSAGE in errors),
+        'errors': errors,                                           # Error messages of the failed starts
+        'wall_time': time.time() - start_time}                      # Elapsed wall time in seconds
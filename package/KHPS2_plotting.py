@@ -1,6 +1,8 @@
     # Library import
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
 
     # KHPS2 plotting function
@@ -39,22 +41,50 @@ def KHPS2_plotting(x_tri, y_invar, ef, tri1, invar1, ef1, tri_k, invar_k,
             - 'marker_styles', 'marker_size_area', 'marker_face_colors', 'marker_edge_color', 'marker_edge_linewidth',
             - 'plot_cut_off_plane', 'cut_off_plane_color', 'cut_off_plane_alpha',
             - 'plot_plane_stress_curve', 'plot_approximated_points', 'plot_constant_invariant_curves'.
+            Optional keys of the fast rendering path:
+            - 'max_surface_triangles': Triangle budget of the main surface and the cut-off plane.
+              The locus mesh is decimated (every n-th row and column, edges kept) to fit the budget.
+              Default None plots the full arrays with the matplotlib default sampling.
+            - 'output_file': Path of an image file (format from its extension, e.g. .png, .svg, .pdf).
+              The figure is then rendered off-screen without pyplot and without blocking, which is
+              safe in headless batch jobs and parallel worker processes.
+            - 'dpi': Resolution of the saved image, default 100.
 
         Function's output:
-            Displays a 3D plot based on the specified inputs. No value is returned by the function.
+            Displays a 3D plot based on the specified inputs (or saves it to 'output_file').
+            Returns the matplotlib Figure.
     """
 
-    # Figure creation
-    fig = plt.figure(figsize=plotting_options['figure_size'])
+    # Figure creation - off-screen Figure (no pyplot state, no GUI backend) when rendering to a file
+    output_file = plotting_options.get('output_file')
+    if output_file is None:
+        fig = plt.figure(figsize=plotting_options['figure_size'])
+    else:
+        fig = Figure(figsize=plotting_options['figure_size'])
     ax = fig.add_subplot(111, projection='3d')
 
+    # Locus mesh decimation to the triangle budget (shared by the main surface and the cut-off plane)
+    surface_options = {}
+    max_surface_triangles = plotting_options.get('max_surface_triangles')
+    if max_surface_triangles is not None:
+        rows, columns = np.shape(ef)
+        step = max(1, int(np.ceil(np.sqrt(2 * (rows - 1) * (columns - 1) / max_surface_triangles))))
+        row_index = np.unique(np.r_[0:rows:step, rows - 1])
+        column_index = np.unique(np.r_[0:columns:step, columns - 1])
+        mesh = np.ix_(row_index, column_index)
+        x_surface, y_surface, ef_surface, tri_c_surface = x_tri[mesh], y_invar[mesh], ef[mesh], tri_c[mesh]
+        surface_options = {'rcount': row_index.size, 'ccount': column_index.size}
+    else:
+        x_surface, y_surface, ef_surface, tri_c_surface = x_tri, y_invar, ef, tri_c
+
     # Graph limits
     ax.set_xlim(plotting_options['x_lim'])
     ax.set_ylim(plotting_options['y_lim'])
     ax.set_zlim(plotting_options['z_lim'])
 
     # Main surface plot
-    surf = ax.plot_surface(x_tri, y_invar, ef, cmap='viridis', edgecolor='none', alpha=plotting_options['surface_alpha'])
+    surf = ax.plot_surface(x_surface, y_surface, ef_surface, cmap='viridis', edgecolor='none',
+                           alpha=plotting_options['surface_alpha'], **surface_options)
 
     # Labels and title setting
     ax.set_xlabel(plotting_options['x_label'], fontsize=plotting_options['label_font_size'], fontweight='bold', labelpad=plotting_options['labelpad_x'])
@@ -69,10 +99,10 @@ def KHPS2_plotting(x_tri, y_invar, ef, tri1, invar1, ef1, tri_k, invar_k,
 
     # Cut-off plane plot
     if plotting_options['plot_cut_off_plane']:
-        cut_off_plane = ax.plot_surface(tri_c, y_invar, ef,
+        cut_off_plane = ax.plot_surface(tri_c_surface, y_surface, ef_surface,
                                         color=plotting_options['cut_off_plane_color'],
                                         alpha=plotting_options['cut_off_plane_alpha'],
-                                        edgecolor='none')
+                                        edgecolor='none', **surface_options)
 
     # Plane stress curve plot
     if plotting_options['plot_plane_stress_curve']:
@@ -93,17 +123,23 @@ def KHPS2_plotting(x_tri, y_invar, ef, tri1, invar1, ef1, tri_k, invar_k,
                 linewidth=plotting_options['constant_invariant_line_width'],
                 color=plotting_options['constant_invariant_line_color'])
 
-    # Calibration point plot
+    # Calibration point plot - one scatter call per marker style (a scatter call supports a single marker)
     if plotting_options['plot_approximated_points']:
-        specimen_names = list(specimen_data.keys())
-        for i in range(len(specimen_data)):
-            ax.scatter(tri_k[i], invar_k[i], ef_k[i],
-                       marker=plotting_options['marker_styles'][i],
+        face_colors = to_rgba_array(plotting_options['marker_face_colors'][:len(specimen_data)])     # RGB, RGBA or named colors
+        groups = {}         # repr(marker): (marker, specimen indices) - markers may be unhashable (e.g. vertex arrays)
+        for i, marker in enumerate(plotting_options['marker_styles'][:len(specimen_data)]):
+            groups.setdefault(repr(marker), (marker, []))[1].append(i)
+        for marker, same_marker in groups.values():
+            ax.scatter(np.asarray(tri_k)[same_marker], np.asarray(invar_k)[same_marker], np.asarray(ef_k)[same_marker],
+                       marker=marker,
                        s=plotting_options['marker_size_area'],
                        edgecolor=plotting_options['marker_edge_color'],
                        linewidth=plotting_options['marker_edge_linewidth'],
-                       facecolor=plotting_options['marker_face_colors'][i],
-                       label=f'{specimen_names[i]}')
+                       facecolor=face_colors[same_marker])
 
-    # Display
-    plt.show()
\ No newline at end of file
+    # Display, or off-screen rendering to the output file
+    if output_file is None:
+        plt.show()
+    else:
+        fig.savefig(output_file, dpi=plotting_options.get('dpi', 100))
+    return fig
@@ -0,0 +1,128 @@
+    # Library import
+import numpy as np
+
+    # Precompiled residual evaluator of the KHPS2 ductile fracture criterion
+        # ef = (G4*a + G5*b + G6*c) / d      d = tri + G1*a + G2*c + G3*b
+        # a = (invar**2 + invar)/2   b = (invar**2 - invar)/2   c = 1 - invar**2
+class KHPS2Residual:
+    """
+    Residual evaluator of the KHPS2 ductile fracture criterion with packed specimen storage.
+
+    The object gives the same residuals as KHPS2_function and the same Jacobian as
+    KHPS2_jacobian, but converts the specimen dictionary only once. The measured values
+    are packed into one contiguous (3, n) array and the invariant terms of the KHPS2
+    formula (a, b, c above) are precomputed, so that each evaluation reduces to two
+    small dot products, one reciprocal and one fused multiply-subtract written into
+    preallocated buffers.
+
+    Object creation:
+        residual = KHPS2Residual(specimen_data, denominator_epsilon)
+        residual = KHPS2Residual.from_arrays(ef_k, tri_k, invar_k, denominator_epsilon)
+
+    Input args:
+        specimen_data: A dictionary containing experimental specimen data.
+            Format: {specimen_name: [Fracture strain, Stress triaxiality, Normalized third invariant]}.
+        denominator_epsilon: A small value to prevent division by zero, ensuring numerical stability.
+            float with default value of 1e-6
+
+    Usage with 'scipy.optimize.least_squares':
+        least_squares(residual, initial_G, jac=residual.jac, bounds=(lower_bounds, upper_bounds))
+        Calling the object returns a copy of the residual buffer, because the optimizer keeps
+        the residual vectors of previous iterations. 'residuals' and 'jacobian' return the
+        internal buffers (or 'out'), which are overwritten by the next evaluation.
+
+    Counters:
+        n_residual_evaluations, n_jacobian_evaluations: Number of 'residuals' and 'jacobian'
+            evaluations since creation (finite difference steps of the optimizer included).
+    """
+
+    def __init__(self, specimen_data, denominator_epsilon=1e-6):
+        self.specimen_names = list(specimen_data.keys())
+        self._pack(np.array(list(specimen_data.values()), dtype=float).T, denominator_epsilon)
+
+    @classmethod
+    def from_arrays(cls, ef_k, tri_k, invar_k, denominator_epsilon=1e-6):
+        """
+        Creates the residual evaluator directly from 1D arrays of measured fracture strains,
+        stress triaxialities and normalized third invariants.
+        """
+        residual = cls.__new__(cls)
+        residual._pack(np.array([ef_k, tri_k, invar_k], dtype=float), denominator_epsilon)
+        residual.specimen_names = [f"specimen{i + 1}" for i in range(residual.size)]
+        return residual
+
+    def _pack(self, specimens_np_array, denominator_epsilon):
+        # Contiguous storage of the measured values - rows: Fracture strain, Stress triaxiality, Normalized third invariant
+        self._specimens = np.ascontiguousarray(specimens_np_array)
+        self.ef_k, self.tri_k, self.invar_k = self._specimens
+        self.size = self.ef_k.size
+        self.denominator_epsilon = denominator_epsilon
+
+        # Precomputed invariant terms of the cut-off triaxiality (G1, G2, G3) and of the numerator (G4, G5, G6)
+        invar_squared = self.invar_k**2
+        a = (invar_squared + self.invar_k) / 2
+        b = (invar_squared - self.invar_k) / 2
+        c = 1 - invar_squared
+        self._cut_off_basis = np.ascontiguousarray([a, c, b])
+        self._strain_basis = np.ascontiguousarray([a, b, c])
+
+        # Preallocated evaluation buffers
+        self._denominator = np.empty(self.size)
+        self._numerator = np.empty(self.size)
+        self._inverse = np.empty(self.size)
+        self._mask = np.empty(self.size, dtype=bool)
+        self._residuals = np.empty(self.size)
+        self._jacobian = np.empty((self.size, 6))
+        self.n_residual_evaluations = 0
+        self.n_jacobian_evaluations = 0
+
+    def _evaluate(self, G):
+        # Denominator (tri - tri_c) and numerator of the fracture strain, filtered like in locus_calculation
+        G = np.asarray(G, dtype=float)
+        np.dot(G[:3], self._cut_off_basis, out=self._denominator)
+        self._denominator += self.tri_k
+        np.abs(self._denominator, out=self._inverse)
+        np.less(self._inverse, self.denominator_epsilon, out=self._mask)
+        np.copyto(self._denominator, np.nan, where=self._mask)
+        np.divide(1.0, self._denominator, out=self._inverse)
+        np.dot(G[3:], self._strain_basis, out=self._numerator)
+
+    def residuals(self, G, out=None):
+        """
+        Evaluates the residuals (measured - predicted fracture strain) for the parameters G
+        into 'out' (or the internal buffer) and returns it.
+        """
+        out = self._residuals if out is None else out
+        self.n_residual_evaluations += 1
+        self._evaluate(G)
+        np.multiply(self._numerator, self._inverse, out=out)
+        np.subtract(self.ef_k, out, out=out)
+        return out
+
+    def jacobian(self, G, out=None):
+        """
+        Evaluates the (n, 6) Jacobian of the residuals with respect to G1,... G6
+        into 'out' (or the internal buffer) and returns it.
+        """
+        out = self._jacobian if out is None else out
+        self.n_jacobian_evaluations += 1
+        self._evaluate(G)
+        np.multiply(self._inverse, self._inverse, out=self._denominator)
+        self._denominator *= self._numerator            # Derivative factor of G1, G2, G3:  numerator / denominator**2
+        np.multiply(self._cut_off_basis.T, self._denominator[:, None], out=out[:, :3])
+        np.multiply(self._strain_basis.T, self._inverse[:, None], out=out[:, 3:])
+        np.negative(out[:, 3:], out=out[:, 3:])
+        return out
+
+    def fracture_strain(self, G):
+        """
+        Returns the predicted fracture strain of the KHPS2 locus at the specimen stress states.
+        """
+        self._evaluate(G)
+        return self._numerator * self._inverse
+
+    def __call__(self, G):
+        return self.residuals(G).copy()
+
+    def jac(self, G, *args):
+        return self.jacobian(G).copy()
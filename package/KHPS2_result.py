@@ -0,0 +1,216 @@
+    # Standard library import
+import time
+from functools import cached_property
+import numpy as np
+
+    # Custom package import
+from .Locus_calculation import locus_calculation, cut_off_triaxiality, TILE_ELEMENTS
+
+    # Default resolution and ranges of the locus surface and the plane stress curve
+DEFAULT_LOCUS_OPTIONS = {
+    'grid_resolution': 999,             # Number of grid points per axis, or (triaxiality points, invariant points)
+    'tri_range': (-3, 3),               # Stress triaxiality range of the locus surface
+    'invar_range': (-1, 1),             # Normalized third invariant range of the locus surface
+    'plane_stress_resolution': 999,     # Number of points of the plane stress curve
+    'dtype': None}                      # Locus surface dtype - None (reference float64 evaluation), 'float64' or 'float32'
+
+
+    # KHPS2 locus surface calculation function
+def locus_surface_grid(G_params, denominator_epsilon, z_lim, locus_options=None):
+    """
+    Calculates the 3D KHPS2 fracture locus surface on a regular (triaxiality, invariant) grid.
+
+    Function execution:
+        x_tri, y_invar, ef, tri_c = locus_surface_grid(G_params, denominator_epsilon, z_lim, locus_options=None)
+
+    Function's input args:
+        G_params: A 1D NumPy array of material parameters [G1, G2, G3, G4, G5, G6].
+        denominator_epsilon: Numerical stability constant of 'locus_calculation'.
+        z_lim: A list [min_z, max_z]. Fracture strains above 'max_z' are set to NaN.
+        locus_options: A dictionary overriding entries of 'DEFAULT_LOCUS_OPTIONS'
+            ('grid_resolution', 'tri_range', 'invar_range', 'dtype').
+
+    Memory-lean mode ('dtype' set to 'float32' or 'float64'):
+        Only 'ef' is allocated as a full array of that dtype. It is evaluated tile by tile
+        with the suppression applied in place. 'x_tri', 'y_invar' and 'tri_c' are read-only
+        broadcast views of 1D arrays (tri_c only depends on the invariant), so a 4000 x 4000
+        float32 surface needs about 64 MB instead of several GB.
+
+    Function's return args:
+        x_tri, y_invar: 2D meshgrids of stress triaxiality and normalized third invariant.
+        ef: 2D array of fracture strains, NaN behind the cut-off plane, below 0 and above 'max_z'.
+        tri_c: 2D array of cut-off stress triaxiality values, used for plotting the cut-off plane.
+    """
+    locus_options = {**DEFAULT_LOCUS_OPTIONS, **(locus_options or {})}
+    n_tri, n_invar = np.broadcast_to(locus_options['grid_resolution'], 2)
+
+    # Mesh matrix creation (Stress triaxiality - Normalized third invariant)
+    Y_invar = np.linspace(*locus_options['invar_range'], n_invar)      # Normalized third invariant - y coordinate
+    X_tri = np.linspace(*locus_options['tri_range'], n_tri)            # Stress triaxiality - x coordinate
+    if locus_options['dtype'] is not None:
+        ef = np.empty((n_invar, n_tri), dtype=locus_options['dtype'])
+        tri_c_column = _locus_surface_tiles(G_params, denominator_epsilon, z_lim, X_tri, Y_invar, ef)
+        x_tri, y_invar = np.meshgrid(X_tri, Y_invar, copy=False)       # Broadcast views
+        return x_tri, y_invar, ef, np.broadcast_to(tri_c_column, ef.shape)
+    x_tri, y_invar = np.meshgrid(X_tri, Y_invar)                       # Grid mesh creation
+
+    # Locus cut-off plane stress triaxiality and fracture stain calculation
+    tri_c, ef = locus_calculation(G_params, x_tri, y_invar, denominator_epsilon)
+    ef[x_tri < tri_c] = np.nan              # Fracture strain suppression behind cut-off plane
+    ef[ef < 0] = np.nan                     # Fracture strain suppression below 0 Z-coordinate
+    ef[ef > z_lim[1]] = np.nan              # Fracture strain suppression above Z axis limit (using z_lim[1] for consistency)
+    return x_tri, y_invar, ef, tri_c
+
+
+    # Tiled locus surface evaluation with in-place suppression (memory-lean mode and memory-mapped output)
+def _locus_surface_tiles(G_params, denominator_epsilon, z_lim, X_tri, Y_invar, ef):
+    # Rows of 'ef' (invariant) are filled in tiles; returns the cut-off triaxiality column
+    tri_c_column = cut_off_triaxiality(G_params, Y_invar)[:, None]
+    rows = max(1, TILE_ELEMENTS // X_tri.size)
+    for start in range(0, Y_invar.size, rows):
+        tile = slice(start, start + rows)
+        ef_tile = ef[tile]
+        locus_calculation(G_params, X_tri[None, :], Y_invar[tile, None], denominator_epsilon, out=(None, ef_tile))
+        with np.errstate(invalid='ignore'):
+            suppressed = X_tri[None, :] < tri_c_column[tile]   # Fracture strain suppression behind cut-off plane
+            suppressed |= ef_tile < 0                           # Fracture strain suppression below 0 Z-coordinate
+            suppressed |= ef_tile > z_lim[1]                    # Fracture strain suppression above Z axis limit
+        np.copyto(ef_tile, np.nan, where=suppressed)
+    return tri_c_column
+
+
+    # KHPS2 locus surface export to a memory-mapped .npy file
+def locus_grid_memmap(G_params, denominator_epsilon, z_lim, path, locus_options=None, dtype=np.float32):
+    """
+    Evaluates the KHPS2 locus surface tile by tile directly into a memory-mapped .npy file,
+    so surfaces larger than the available memory can be produced and exported.
+
+    Function execution:
+        tri_axis, invar_axis, ef, tri_c_axis = locus_grid_memmap(G_params, denominator_epsilon, z_lim, path,
+                                                                 locus_options=None, dtype=np.float32)
+
+    Function's input args:
+        G_params, denominator_epsilon, z_lim, locus_options: Same as 'locus_surface_grid'
+            (its 'dtype' entry is ignored).
+        path: Path of the created .npy file (readable with np.load(path, mmap_mode='r')).
+        dtype: dtype of the stored fracture strains, np.float32 by default.
+
+    Function's return args:
+        tri_axis: 1D array of stress triaxiality values (columns of 'ef').
+        invar_axis: 1D array of normalized third invariant values (rows of 'ef').
+        ef: The memory-mapped 2D array (invariant, triaxiality) of fracture strains,
+            suppressed like in 'locus_surface_grid'.
+        tri_c_axis: 1D array of cut-off stress triaxiality values of each row.
+    """
+    locus_options = {**DEFAULT_LOCUS_OPTIONS, **(locus_options or {})}
+    n_tri, n_invar = (int(n) for n in np.broadcast_to(locus_options['grid_resolution'], 2))
+    Y_invar = np.linspace(*locus_options['invar_range'], n_invar)
+    X_tri = np.linspace(*locus_options['tri_range'], n_tri)
+    ef = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(n_invar, n_tri))
+    tri_c_column = _locus_surface_tiles(G_params, denominator_epsilon, z_lim, X_tri, Y_invar, ef)
+    ef.flush()
+    return X_tri, Y_invar, ef, tri_c_column[:, 0]
+
+
+    # KHPS2 plane stress curve calculation function
+def plane_stress_curve(G_params, denominator_epsilon, z_lim, locus_options=None):
+    """
+    Calculates the KHPS2 fracture strain along the plane stress curve.
+
+    Function execution:
+        tri1, invar1, ef1 = plane_stress_curve(G_params, denominator_epsilon, z_lim, locus_options=None)
+
+    Function's input args:
+        Same as 'locus_surface_grid', the number of points being 'plane_stress_resolution'.
+
+    Function's return args:
+        tri1, invar1: 1D arrays of stress triaxiality and normalized third invariant of the plane stress state.
+        ef1: 1D array of fracture strains, NaN below 0 and above 'max_z'.
+    """
+    locus_options = {**DEFAULT_LOCUS_OPTIONS, **(locus_options or {})}
+
+    # Calculation of the plane stress curve
+    tri1 = np.linspace(-2/3, 2/3, locus_options['plane_stress_resolution'])     # Plane stress state - triaxiality
+    invar1 = -27/2. * tri1 * (tri1**2 - 1/3)                                    # Plane stress state - normalized third invariant
+
+    # Plane stress cut-off plane stress triaxiality and fracture stain calculation
+    tri_c1, ef1 = locus_calculation(G_params, tri1, invar1, denominator_epsilon)
+    ef1[ef1 < 0] = np.nan                     # Fracture strain suppression below 0 Z-coordinate
+    ef1[ef1 > z_lim[1]] = np.nan              # Fracture strain suppression above Z axis limit
+    return tri1, invar1, ef1
+
+
+    # KHPS2 calibration result
+class KHPS2Result:
+    """
+    Lightweight result of a KHPS2 calibration with lazily computed locus geometry.
+
+    The calibrated parameters and the calibration errors are stored directly. The locus
+    surface (and its cut-off plane) and the plane stress curve are only calculated on
+    first access of the corresponding attributes and are then kept, so headless runs
+    which only need G1,... G6 and the errors never build the locus grid.
+
+    Attributes:
+        final_G_params: Calibrated material parameters [G1, G2, G3, G4, G5, G6].
+        tri_k, invar_k, ef_k: Measured stress triaxiality, normalized third invariant and
+            fracture strain of the calibration points.
+        ef_r, total_abs_difference, p_calibration_error, pt_calibration_error:
+            Calibration errors, see 'KHPS2_calculation'.
+        optimization_result: The 'least_squares' result, or None.
+        diagnostics: Dictionary of optimizer statistics and per-stage wall times
+            (see 'KHPS2_diagnostics'). The lazy stages add their 'wall_time' entries
+            ('locus_surface', 'plane_stress') when they are calculated.
+        denominator_epsilon, z_lim, locus_options: Settings of the lazy locus calculation.
+
+    Lazy attributes:
+        x_tri, y_invar, ef, tri_c: Locus surface and cut-off plane (see 'locus_surface_grid').
+        tri1, invar1, ef1: Plane stress curve (see 'plane_stress_curve').
+    """
+
+    def __init__(self, final_G_params, ef_k, tri_k, invar_k, calibration_error,
+                 denominator_epsilon, z_lim, optimization_result=None, locus_options=None, diagnostics=None):
+        self.final_G_params = final_G_params
+        self.ef_k = ef_k
+        self.tri_k = tri_k
+        self.invar_k = invar_k
+        self.ef_r, self.total_abs_difference, self.p_calibration_error, self.pt_calibration_error = calibration_error
+        self.denominator_epsilon = denominator_epsilon
+        self.z_lim = z_lim
+        self.optimization_result = optimization_result
+        self.locus_options = {**DEFAULT_LOCUS_OPTIONS, **(locus_options or {})}
+        self.diagnostics = diagnostics if diagnostics is not None else {'wall_time': {}}
+
+    @cached_property
+    def locus_surface(self):
+        """Tuple (x_tri, y_invar, ef, tri_c) of the locus surface, calculated on first access."""
+        start = time.perf_counter()
+        surface = locus_surface_grid(self.final_G_params, self.denominator_epsilon, self.z_lim, self.locus_options)
+        self.diagnostics['wall_time']['locus_surface'] = time.perf_counter() - start
+        return surface
+
+    @cached_property
+    def plane_stress(self):
+        """Tuple (tri1, invar1, ef1) of the plane stress curve, calculated on first access."""
+        start = time.perf_counter()
+        curve = plane_stress_curve(self.final_G_params, self.denominator_epsilon, self.z_lim, self.locus_options)
+        self.diagnostics['wall_time']['plane_stress'] = time.perf_counter() - start
+        return curve
+
+    x_tri = property(lambda self: self.locus_surface[0])
+    y_invar = property(lambda self: self.locus_surface[1])
+    ef = property(lambda self: self.locus_surface[2])
+    tri_c = property(lambda self: self.locus_surface[3])
+    tri1 = property(lambda self: self.plane_stress[0])
+    invar1 = property(lambda self: self.plane_stress[1])
+    ef1 = property(lambda self: self.plane_stress[2])
+
+    def release_locus(self):
+        """Frees the cached locus surface and plane stress curve (recalculated on next access)."""
+        self.__dict__.pop('locus_surface', None)
+        self.__dict__.pop('plane_stress', None)
+
+    def as_tuple(self):
+        """Returns the 15 values of 'KHPS2_calculation' in its order (computes the locus if needed)."""
+        return (self.final_G_params, self.x_tri, self.y_invar, self.ef, self.tri1, self.invar1, self.ef1,
+                self.tri_k, self.invar_k, self.ef_k, self.ef_r, self.total_abs_difference,
+                self.p_calibration_error, self.pt_calibration_error, self.tri_c)
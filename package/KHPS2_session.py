@@ -0,0 +1,216 @@
+    # Library import
+import numpy as np
+
+    # Custom package import
+from .KHPS2_calculation import KHPS2_optimization, KHPS2_calibration_error
+from .KHPS2_residual import KHPS2Residual
+from .KHPS2_result import KHPS2Result
+
+
+    # Incremental KHPS2 calibration session
+class KHPS2CalibrationSession:
+    """
+    Incremental KHPS2 calibration of a material whose specimen set grows or changes over time.
+
+    The session keeps the packed specimen arrays, the last calibrated parameters and the
+    per-specimen calibration errors. Adding, removing or updating a specimen only touches
+    that specimen's entries of 'ef_r' and 'p_calibration_error'. The following 'recalibrate'
+    is warm-started from the last solution instead of 'initial_G'. All error metrics are
+    recomputed only when the parameters actually changed.
+
+    The first calibration (on creation) is a cold start from 'initial_G'. Evaluations are
+    counted on the residual evaluator, so finite difference Jacobian steps are included.
+    With 'compare_cold_start=True', 'recalibrate' also runs the cold start on the current
+    specimen set and reports the evaluations saved by the warm start; otherwise only the warm
+    start count is reported. A warm start converges to the local minimum next to the previous
+    solution, which can differ from the cold-start minimum when the specimen set changes a lot.
+
+    Object creation:
+        session = KHPS2CalibrationSession(specimen_data, initial_G, lower_bounds, upper_bounds,
+                                          optimization_options, denominator_epsilon, z_lim,
+                                          analytic_jacobian=False, locus_options=None)
+
+    Usage:
+        session.add_specimen('Specimen_7', [0.41, 0.33, 1.0])           # Re-solves warm-started
+        session.update_specimen('Specimen_2', [0.52, 0.60, 0.95], recalibrate=False)
+        session.remove_specimen('Specimen_4', recalibrate=False)
+        report = session.recalibrate()                                  # One solve for both changes
+        result = session.result()                                       # 'KHPS2Result' (locus, plotting)
+
+    Attributes:
+        specimen_data: Current specimen dictionary (a copy of the input).
+        final_G_params: Last calibrated parameters [G1, G2, G3, G4, G5, G6].
+        ef_r, p_calibration_error: Per-specimen calibration errors, in 'specimen_data' order.
+        optimization_result: 'OptimizeResult' of the last solve.
+        cold_nfev: Number of residual evaluations of the initial cold start.
+        n_residual_evaluations: Number of residual evaluations of the last solve.
+        history: List of the 'recalibrate' reports.
+    """
+
+    def __init__(self, specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                 denominator_epsilon, z_lim, analytic_jacobian=False, locus_options=None):
+        self.specimen_data = {name: list(values) for name, values in specimen_data.items()}
+        self.initial_G = np.asarray(initial_G, dtype=float)
+        self.lower_bounds = lower_bounds
+        self.upper_bounds = upper_bounds
+        self.optimization_options = optimization_options
+        self.denominator_epsilon = denominator_epsilon
+        self.z_lim = z_lim
+        self.analytic_jacobian = analytic_jacobian
+        self.locus_options = locus_options
+        self.history = []
+
+        # Packed specimen arrays - rows: Fracture strain, Stress triaxiality, Normalized third invariant
+        self._specimens = np.array(list(self.specimen_data.values()), dtype=float).reshape(-1, 3).T
+        self._residual = None
+        self._pending = False
+
+        # Cold start
+        self.optimization_result, self.n_residual_evaluations = self._solve(self.initial_G)
+        self.final_G_params = self.optimization_result.x
+        self.cold_nfev = self.n_residual_evaluations
+        self.ef_r, _, self.p_calibration_error, _ = self._errors(self._specimens)
+
+    @property
+    def names(self):
+        """Specimen names in the order of the error arrays."""
+        return list(self.specimen_data.keys())
+
+    @property
+    def total_abs_difference(self):
+        """Sum of the absolute values of the (non-NaN) residuals."""
+        return np.sum(np.abs(self.ef_r[~np.isnan(self.ef_r)]))
+
+    @property
+    def pt_calibration_error(self):
+        """Total (sum) calibration error in percentages."""
+        return np.sum(self.p_calibration_error)
+
+    @property
+    def nfev_saved(self):
+        """
+        Total number of residual evaluations saved by the warm-started recalibrations
+        measured with 'compare_cold_start=True'.
+        """
+        return sum(report['nfev_saved'] for report in self.history if report['cold_nfev_measured'])
+
+    def add_specimen(self, name, values, recalibrate=True):
+        """
+        Adds the specimen 'name' with values [Fracture strain, Stress triaxiality,
+        Normalized third invariant]. Returns the 'recalibrate' report, or None if
+        'recalibrate' is False.
+        """
+        if name in self.specimen_data:
+            raise ValueError(f"Specimen '{name}' already exists, use 'update_specimen'.")
+        column = self._column(values)
+        self.specimen_data[name] = list(values)
+        self._specimens = np.concatenate([self._specimens, column], axis=1)
+        ef_r, _, p_calibration_error, _ = self._errors(column)
+        self.ef_r = np.append(self.ef_r, ef_r)
+        self.p_calibration_error = np.append(self.p_calibration_error, p_calibration_error)
+        return self._changed(recalibrate)
+
+    def remove_specimen(self, name, recalibrate=True):
+        """Removes the specimen 'name'. Returns the 'recalibrate' report, or None."""
+        index = self._index(name)
+        if self._specimens.shape[1] == 1:
+            raise ValueError(f"Cannot remove '{name}', the calibration needs at least one specimen.")
+        del self.specimen_data[name]
+        self._specimens = np.delete(self._specimens, index, axis=1)
+        self.ef_r = np.delete(self.ef_r, index)
+        self.p_calibration_error = np.delete(self.p_calibration_error, index)
+        return self._changed(recalibrate)
+
+    def update_specimen(self, name, values, recalibrate=True):
+        """Replaces the values of the specimen 'name'. Returns the 'recalibrate' report, or None."""
+        index = self._index(name)
+        column = self._column(values)
+        self.specimen_data[name] = list(values)
+        self._specimens[:, index] = column[:, 0]
+        ef_r, _, p_calibration_error, _ = self._errors(column)
+        self.ef_r[index], self.p_calibration_error[index] = ef_r[0], p_calibration_error[0]
+        return self._changed(recalibrate)
+
+    def recalibrate(self, compare_cold_start=False):
+        """
+        Re-solves the calibration warm-started from the last parameters.
+
+        Input args:
+            compare_cold_start: If True, the cold start from 'initial_G' is solved on the current
+                specimen set as well, and 'nfev_saved' is the difference of the evaluations.
+
+        Returns a report dictionary (also appended to 'history'):
+            'nfev' (residual evaluations of the warm start, finite difference steps included),
+            'cold_nfev', 'nfev_saved', 'cold_cost' (None if the cold start is not measured),
+            'cold_nfev_measured', 'cost', 'G_changed', 'n_specimens'.
+        """
+        previous_G = self.final_G_params
+        self.optimization_result, self.n_residual_evaluations = \
+            self._solve(np.clip(previous_G, self.lower_bounds, self.upper_bounds))
+        self.final_G_params = self.optimization_result.x
+        self._pending = False
+
+        # Error metrics - the per-specimen entries are already current if G did not move
+        G_changed = not np.array_equal(self.final_G_params, previous_G)
+        if G_changed:
+            self.ef_r, _, self.p_calibration_error, _ = self._errors(self._specimens)
+
+        # Saved residual evaluations versus a cold start on the current specimen set
+        cold_nfev = cold_cost = nfev_saved = None
+        if compare_cold_start:
+            cold_result, cold_nfev = self._solve(self.initial_G)
+            cold_cost = cold_result.cost
+            nfev_saved = cold_nfev - self.n_residual_evaluations
+        report = {
+            'nfev': self.n_residual_evaluations,                    # Residual evaluations of the warm start
+            'cold_nfev': cold_nfev,                                 # Residual evaluations of the cold start (if measured)
+            'nfev_saved': nfev_saved,                               # cold_nfev - nfev (if measured)
+            'cold_nfev_measured': compare_cold_start,               # True - cold start solved on the current set
+            'cost': self.optimization_result.cost,                  # Final cost of the warm start
+            'cold_cost': cold_cost,                                 # Final cost of the cold start (if measured)
+            'G_changed': G_changed,                                 # False - error metrics were kept
+            'n_specimens': len(self.specimen_data)}
+        self.history.append(report)
+        return report
+
+    def result(self):
+        """
+        Returns the current calibration as a 'KHPS2Result' (lazy locus surface and plane stress curve).
+        The arrays are copies, so later specimen changes of the session do not alter the result.
+        """
+        if self._pending:
+            raise RuntimeError("The specimen set changed since the last calibration, call 'recalibrate' first.")
+        ef_k, tri_k, invar_k = self._specimens.copy()
+        return KHPS2Result(self.final_G_params.copy(), ef_k, tri_k, invar_k,
+                           (self.ef_r.copy(), self.total_abs_difference, self.p_calibration_error.copy(),
+                            self.pt_calibration_error),
+                           self.denominator_epsilon, self.z_lim, self.optimization_result, self.locus_options)
+
+    def _solve(self, start_G):
+        # Packed residual evaluator of the current specimen set, rebuilt only after changes
+        if self._residual is None or self._residual.size != self._specimens.shape[1] or self._pending:
+            self._residual = KHPS2Residual.from_arrays(*self._specimens, self.denominator_epsilon)
+            self._residual.specimen_names = self.names
+        n_evaluations = self._residual.n_residual_evaluations
+        result, _ = KHPS2_optimization(self._residual, start_G, self.lower_bounds, self.upper_bounds,
+                                       self.optimization_options, self.denominator_epsilon, self.analytic_jacobian)
+        return result, self._residual.n_residual_evaluations - n_evaluations
+
+    def _errors(self, specimens):
+        # Calibration errors of the given packed specimen columns at the current parameters
+        ef_k, tri_k, invar_k = specimens
+        return KHPS2_calibration_error(self.final_G_params, ef_k, tri_k, invar_k, self.denominator_epsilon)
+
+    def _changed(self, recalibrate):
+        self._pending = True
+        return self.recalibrate() if recalibrate else None
+
+    def _index(self, name):
+        if name not in self.specimen_data:
+            raise KeyError(f"Unknown specimen '{name}'.")
+        return list(self.specimen_data).index(name)
+
+    @staticmethod
+    def _column(values):
+        # Packed (3, 1) column of one specimen
+        return np.asarray(values, dtype=float).reshape(3, 1)
@@ -1,8 +1,11 @@
     # Library import
 import numpy as np
 
+    # Number of values evaluated at once by the memory-lean mode (bounds its temporaries)
+TILE_ELEMENTS = 2**18
+
     # Definition of the KHPS2 ductile fracture criterion mathematical formula
-def locus_calculation(G_params, tri_values, invar_values, denominator_epsilon=1e-6):
+def locus_calculation(G_params, tri_values, invar_values, denominator_epsilon=1e-6, dtype=None, out=None):
     """
     Calculates the cut-off stress triaxiality (tri_c) and fracture strain (ef)
     of the KHPS2 fracture criterion.
@@ -12,11 +15,28 @@ def locus_calculation(G_params, tri_values, invar_values, denominator_epsilon=1e
         tri_values: Array of stress triaxiality values.
         invar_values: Array of normalized third invariant values.
         denominator_epsilon: A small value to prevent division by zero or near-zero.
+        dtype: Optional result dtype (e.g. np.float32 or np.float64) of the memory-lean mode.
+        out: Optional tuple (tri_c, ef) of preallocated result arrays of the memory-lean mode,
+            shaped like the broadcast inputs. The tri_c entry may be None, then the cut-off
+            triaxiality is not stored and None is returned in its place.
+
+    Memory-lean mode (used if 'dtype' or 'out' is given):
+        The results are written directly into 'out' (or into arrays of 'dtype'), evaluated in
+        Horner form tile by tile along the first axis, and the denominator filter is applied
+        in place. The temporaries are bounded by TILE_ELEMENTS values instead of about ten
+        full-size float64 arrays, and the inputs may be broadcasting views (e.g. a row of
+        triaxialities and a column of invariants). The formula is algebraically identical,
+        float64 results match the default mode to rounding. Scalar inputs give scalar results
+        (unless 'out' is given), like the default mode. This is the Horner kernel shared by
+        'KHPS2Locus' and 'cut_off_triaxiality'.
 
     Function outputs:
         (tri_c, ef)
         A tuple containing (cut-off plane stress triaxiality, fracture strain)
     """
+    if dtype is not None or out is not None:
+        return _locus_calculation_lean(G_params, tri_values, invar_values, denominator_epsilon, dtype, out)
+
     # KHPS2_function.py results - calibrated parameters
     G1, G2, G3, G4, G5, G6 = G_params
 
@@ -32,4 +52,64 @@ def locus_calculation(G_params, tri_values, invar_values, denominator_epsilon=1e
          ((1/2) * (G4 / denominator_filtered - G5 / denominator_filtered)) * invar_values + G6 / denominator_filtered
 
     # Functions outputs - Cut-off plane stress triaxiality, fracture strain
-    return tri_c, ef
\ No newline at end of file
+    return tri_c, ef
+
+
+    # Cut-off plane stress triaxiality
+def cut_off_triaxiality(G_params, invar_values):
+    """
+    Returns the cut-off stress triaxiality tri_c of the KHPS2 locus for the given
+    normalized third invariants (same value as the 'tri_c' of 'locus_calculation').
+    """
+    (p2, p1, p0), _ = _horner_coefficients(G_params)
+    invar_values = np.asarray(invar_values, dtype=float)
+    return -((p2 * invar_values + p1) * invar_values + p0)
+
+
+    # Coefficients of the cut-off triaxiality (p) and of the numerator (q) as polynomials in the invariant
+def _horner_coefficients(G_params):
+    G1, G2, G3, G4, G5, G6 = G_params
+    p = ((G1 + G3) / 2 - G2, (G1 - G3) / 2, G2)         # tri_c = -((p2 * invar + p1) * invar + p0)
+    q = ((G4 + G5) / 2 - G6, (G4 - G5) / 2, G6)         # numerator = (q2 * invar + q1) * invar + q0
+    return p, q
+
+
+    # Memory-lean tiled evaluation of locus_calculation
+def _locus_calculation_lean(G_params, tri_values, invar_values, denominator_epsilon, dtype, out):
+    (p2, p1, p0), (q2, q1, q0) = _horner_coefficients(G_params)
+
+    # Broadcast views of the inputs (no copies) and result arrays
+    tri_values, invar_values = np.broadcast_arrays(np.asarray(tri_values), np.asarray(invar_values))
+    shape = tri_values.shape
+    tri_c, ef = out if out is not None else (np.empty(shape, dtype), np.empty(shape, dtype))
+    if ef is None:
+        ef = np.empty(shape, dtype)
+    if tri_values.ndim == 0:
+        tri_values, invar_values, tri_c_2d, ef_2d = (np.reshape(array, 1) if array is not None else None
+                                                     for array in (tri_values, invar_values, tri_c, ef))
+    else:
+        tri_c_2d, ef_2d = tri_c, ef
+
+    # Tiles of whole rows along the first axis
+    row_size = max(1, int(np.prod(shape[1:])))
+    rows = max(1, TILE_ELEMENTS // row_size)
+    for start in range(0, tri_values.shape[0], rows):
+        tile = slice(start, start + rows)
+        tri, invar, ef_tile = tri_values[tile], invar_values[tile], ef_2d[tile]
+        cut_off = np.multiply(invar, p2, out=tri_c_2d[tile] if tri_c_2d is not None else None, dtype=ef.dtype)
+        cut_off += p1
+        cut_off *= invar
+        cut_off += p0
+        np.negative(cut_off, out=cut_off)
+        np.subtract(tri, cut_off, out=ef_tile)                  # Denominator tri - tri_c
+        near_pole = np.abs(ef_tile) < denominator_epsilon      # Denominator filtering for numerical stability
+        numerator = np.multiply(invar, q2, dtype=ef.dtype)
+        numerator += q1
+        numerator *= invar
+        numerator += q0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(numerator, ef_tile, out=ef_tile)
+        np.copyto(ef_tile, np.nan, where=near_pole)
+    if shape == () and out is None:
+        return tri_c[()], ef[()]                            # Scalars, like the default mode
+    return tri_c, ef
@@ -1,13 +1,14 @@
     # Library import
+import time
 import numpy as np
     # Custom package import
 from .KHPS2_calculation import KHPS2_calculation
-from .KHPS2_plotting import KHPS2_plotting
 
     # Calculation and plotting return function wrapper
 def run_khps2_analysis(specimen_data, initial_G, lower_bounds, upper_bounds,
                        optimization_options, denominator_epsilon, z_lim,
-                       plotting_options):
+                       plotting_options, analytic_jacobian=False, locus_options=None,
+                       cache=None, refresh_cache=False, callback=None):
     """
     Orchestrates the entire KHPS2 fracture criterion analysis pipeline.
 
@@ -18,7 +19,8 @@ def run_khps2_analysis(specimen_data, initial_G, lower_bounds, upper_bounds,
     Function execution:
         results = run_khps2_analysis(specimen_data, initial_G, lower_bounds, upper_bounds,
                                      optimization_options, denominator_epsilon, z_lim,
-                                     plotting_options)
+                                     plotting_options, analytic_jacobian=False, locus_options=None,
+                                     cache=None, refresh_cache=False, callback=None)
 
     Function's input parameters:
         specimen_data: A dictionary containing experimental specimen data.
@@ -37,6 +39,17 @@ def run_khps2_analysis(specimen_data, initial_G, lower_bounds, upper_bounds,
             (Fracture strain) in figures.
         plotting_options: A dictionary containing all configurable plotting parameters.
             Expected keys are detailed in the 'KHPS2_plotting' function's docstring.
+        analytic_jacobian: If True, the optimizer uses the closed-form Jacobian of the
+            residuals instead of finite differences. Default is False.
+        locus_options: Optional dictionary with the resolution and ranges of the plotted locus
+            surface and plane stress curve (see 'DEFAULT_LOCUS_OPTIONS' in KHPS2_result.py).
+        cache: Optional 'KHPS2Cache'. Repeated calls with the same specimen data, initial_G,
+            bounds, optimization options and denominator_epsilon then reuse the cached
+            calibration instead of re-solving (e.g. when only plotting_options change).
+            None (default) bypasses the cache.
+        refresh_cache: If True, the cached entry is ignored, recalculated and replaced.
+        callback: Optional function callback(G, cost, elapsed) called after every residual
+            evaluation of the optimizer (see 'KHPS2_calculation'). Not called on cache hits.
 
     Function's returned value:
         A dictionary containing key results from the analysis:
@@ -49,20 +62,37 @@ def run_khps2_analysis(specimen_data, initial_G, lower_bounds, upper_bounds,
               values, representing the total percentage calibration error.
             - 'ef_r' (np.array): A 1D NumPy array representing the residuals (differences)
               between measured and predicted fracture strains for each calibration point.
+            - 'diagnostics': Dictionary of optimizer statistics and per-stage wall times
+              (see 'KHPS2_diagnostics'), including the 'plotting' wall time. On cache hits,
+              the optimizer values are those of the cached run.
     """
 
-    # Calculations using the KHPS2_calculation package function
+    # Calculations using the KHPS2_calculation package function (or the result cache, if given)
         # Returns calibrated parameters and other datas
-    (final_G_params, x_tri, y_invar, ef, tri1, invar1, ef1,
-     tri_k, invar_k, ef_k, ef_r, total_abs_difference, p_calibration_error,
-     pt_calibration_error, tri_c) = \
-        KHPS2_calculation(specimen_data, initial_G, lower_bounds, upper_bounds,
-                          optimization_options, denominator_epsilon, z_lim)
+    if cache is not None:
+        result = cache.calibrate(specimen_data, initial_G, lower_bounds, upper_bounds, optimization_options,
+                                 denominator_epsilon, z_lim, analytic_jacobian, locus_options, refresh=refresh_cache,
+                                 callback=callback)
+        (final_G_params, x_tri, y_invar, ef, tri1, invar1, ef1,
+         tri_k, invar_k, ef_k, ef_r, total_abs_difference, p_calibration_error,
+         pt_calibration_error, tri_c) = result.as_tuple()
+        diagnostics = {**result.diagnostics, 'wall_time': dict(result.diagnostics['wall_time'])}   # Cached record untouched
+    else:
+        (final_G_params, x_tri, y_invar, ef, tri1, invar1, ef1,
+         tri_k, invar_k, ef_k, ef_r, total_abs_difference, p_calibration_error,
+         pt_calibration_error, tri_c, diagnostics) = \
+            KHPS2_calculation(specimen_data, initial_G, lower_bounds, upper_bounds,
+                              optimization_options, denominator_epsilon, z_lim, analytic_jacobian,
+                              locus_options, callback, return_diagnostics=True)
 
     # Plot generation using the KHPS2_plotting package function
+        # Imported here, so that importing this module does not load matplotlib
         # Displays the plot
+    from .KHPS2_plotting import KHPS2_plotting
+    start = time.perf_counter()
     KHPS2_plotting(x_tri, y_invar, ef, tri1, invar1, ef1,
                    tri_k, invar_k, ef_k, specimen_data, plotting_options, tri_c)
+    diagnostics['wall_time']['plotting'] = time.perf_counter() - start
 
     # Return relevant results
     return {
@@ -70,4 +100,5 @@ def run_khps2_analysis(specimen_data, initial_G, lower_bounds, upper_bounds,
         'total_abs_difference': total_abs_difference,       # Total calibration error (Sum of calibration errors)
         'p_calibration_error': p_calibration_error,         # Calibration error in percentages for each specimen
         'pt_calibration_error': pt_calibration_error,       # Total (Sum) calibration error in percentages
-        'ef_r': ef_r}                                       # Calibration error - difference between calibration points and the calibrated locus
\ No newline at end of file
+        'ef_r': ef_r,                                       # Calibration error - difference between calibration points and the calibrated locus
+        'diagnostics': diagnostics}                         # Optimizer statistics and per-stage wall times
\ No newline at end of file
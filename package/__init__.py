@@ -0,0 +1,51 @@
+    # Standard library import
+import importlib
+
+    # Public API - name: defining module. The modules are imported lazily on first attribute access
+    # (PEP 562), so 'import package' loads neither SciPy nor matplotlib, and the compute modules never
+    # import a plotting backend. 'run_khps2_analysis' loads matplotlib only when it plots.
+    # Functions named like their module (KHPS2_calculation, KHPS2_function, KHPS2_multistart,
+    # KHPS2_bootstrap, KHPS2_plotting) are not exported here - 'package.<name>' is always the
+    # submodule, import them with 'from package.<name> import <name>'.
+_EXPORTS = {
+    'locus_calculation': 'Locus_calculation',
+    'cut_off_triaxiality': 'Locus_calculation',
+    'KHPS2_jacobian': 'KHPS2_function',
+    'KHPS2Residual': 'KHPS2_residual',
+    'KHPS2_calibration': 'KHPS2_calculation',
+    'KHPS2_optimization': 'KHPS2_calculation',
+    'KHPS2_calibration_error': 'KHPS2_calculation',
+    'KHPS2_diagnostics': 'KHPS2_calculation',
+    'KHPS2Result': 'KHPS2_result',
+    'DEFAULT_LOCUS_OPTIONS': 'KHPS2_result',
+    'locus_surface_grid': 'KHPS2_result',
+    'plane_stress_curve': 'KHPS2_result',
+    'locus_grid_memmap': 'KHPS2_result',
+    'CALIBRATION_DTYPE': 'KHPS2_batch',
+    'calibrate_many': 'KHPS2_batch',
+    'KHPS2_starting_points': 'KHPS2_multistart',
+    'AdaptiveLocusMesh': 'KHPS2_adaptive',
+    'adaptive_locus_surface': 'KHPS2_adaptive',
+    'KHPS2Locus': 'KHPS2_locus',
+    'KHPS2DamageAccumulator': 'KHPS2_damage',
+    'load_path_chunks': 'KHPS2_damage',
+    'accumulate_damage': 'KHPS2_damage',
+    'KHPS2Cache': 'KHPS2_cache',
+    'KHPS2CalibrationSession': 'KHPS2_session',
+    'run_khps2_analysis': 'Main_workflow',
+}
+
+__all__ = list(_EXPORTS)
+
+
+    # Lazy attribute access (PEP 562)
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value         # Cached - no exported name is also a submodule name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))